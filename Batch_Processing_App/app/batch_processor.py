@@ -16,6 +16,9 @@ Date: October 2025
 
 import sys
 import os
+import atexit
+import threading
+import importlib.util
 from pathlib import Path
 
 # Add parent directory to path to allow importing qmra_core
@@ -26,13 +29,16 @@ import numpy as np
 import yaml
 import json
 from datetime import datetime
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from functools import lru_cache
 import warnings
 
 # Import QMRA core modules from local qmra_core package
 try:
     from qmra_core import (
-        PathogenDatabase,
-        create_dose_response_model,
+        get_pathogen_database,
+        get_default_dose_response_model,
         MonteCarloSimulator,
         create_lognormal_distribution,
         create_uniform_distribution,
@@ -45,10 +51,22 @@ try:
         calculate_illness_risk_metrics,
         calculate_population_illness_cases
     )
+    from qmra_core.dose_response import BetaBinomialModel, BetaPoissonModel
+    from qmra_core.fast_sampling import (
+        NUMBA_AVAILABLE,
+        beta_binomial_probability,
+        beta_poisson_probability,
+        resolve_use_numba
+    )
     QMRA_MODULES_AVAILABLE = True
 except ImportError as e:
     warnings.warn(f"QMRA core modules not found ({e}). Using simplified calculations.")
     QMRA_MODULES_AVAILABLE = False
+    NUMBA_AVAILABLE = False
+
+# Parquet needs pyarrow or fastparquet; CSV output is always written
+PARQUET_AVAILABLE = any(importlib.util.find_spec(engine) is not None
+                        for engine in ('pyarrow', 'fastparquet'))
 
 
 def detect_exposure_route(scenario_row):
@@ -107,21 +125,199 @@ def get_route_exposure_parameters(exposure_route, scenario_row):
     return route_params
 
 
+@lru_cache(maxsize=None)
+def _load_yaml(path, mtime):
+    """Parse a YAML file; ``mtime`` is only part of the cache key."""
+    with open(path, 'r') as f:
+        return yaml.safe_load(f)
+
+
+def load_treatment_config(treatment_file):
+    """Load a treatment scenario YAML, parsed once per file version."""
+    return _load_yaml(str(treatment_file), os.path.getmtime(treatment_file))
+
+
+# Buffer size for results CSV writes (the default is 8 KB)
+CSV_WRITE_BUFFER = 1 << 18
+
+# Below this many doses the parallel kernels cost more to launch than they save
+KERNEL_MIN_DOSES = 512
+
+
+def save_results(results_df, output_path, write_parquet=False):
+    """
+    Save a results table as CSV, optionally with a Parquet copy alongside it.
+
+    The CSV remains the user-facing export. With write_parquet, a
+    ``.parquet`` sidecar keeps full float precision and reloads much faster,
+    so the web app prefers it when present; it is off by default so batch
+    runs and tests leave only the CSV behind. If the Parquet write fails
+    (e.g. mixed-type columns) any stale sidecar is removed so readers fall
+    back to the CSV.
+    """
+    output_path = Path(output_path)
+    # Large write buffer and bounded chunks keep syscalls and peak memory low
+    with open(output_path, 'w', newline='', encoding='utf-8', buffering=CSV_WRITE_BUFFER) as f:
+        results_df.to_csv(f, index=False, chunksize=10_000)
+
+    if write_parquet and PARQUET_AVAILABLE:
+        parquet_path = output_path.with_suffix('.parquet')
+        try:
+            results_df.to_parquet(parquet_path, index=False)
+        except (ValueError, TypeError) as e:
+            warnings.warn(f"Could not write {parquet_path.name} ({e}); CSV only.")
+            parquet_path.unlink(missing_ok=True)
+
+
+# One processor per worker process, reused across the tasks it receives
+_worker_processor = None
+
+
+# Worker pools kept alive between runs, so repeated assessments (e.g. reruns
+# from the web app) do not pay process start-up each time. Streamlit runs
+# every session in its own thread, so there is one pool per size, guarded
+# by a lock: a session asking for a different size never tears down a pool
+# another session is still mapping over.
+_executors = {}
+_executors_lock = threading.Lock()
+
+
+def _get_executor(n_workers):
+    """
+    Return the shared process pool with n_workers processes, creating it if needed.
+
+    Pools are process-wide: every caller (and every Streamlit session) asking
+    for the same size maps over the same workers, so tasks must not rely on
+    worker state beyond the per-process processor. On Linux the workers are
+    forked from the calling process, which under Streamlit is multi-threaded;
+    the workers only import this module and run assessments, so they never
+    touch locks another thread may have held at fork time. Keep n_workers
+    small in the web app, where the pool is shared by all sessions.
+    """
+    with _executors_lock:
+        executor = _executors.get(n_workers)
+        if executor is None:
+            executor = ProcessPoolExecutor(max_workers=n_workers)
+            _executors[n_workers] = executor
+        return executor
+
+
+def _discard_executor(executor):
+    """Drop a broken pool so the next run starts a fresh one."""
+    with _executors_lock:
+        for n_workers, pooled in list(_executors.items()):
+            if pooled is executor:
+                del _executors[n_workers]
+    # A broken pool has already failed its pending futures, so there is
+    # nothing to cancel (cancel_futures would also need Python 3.9+)
+    executor.shutdown(wait=False)
+
+
+@atexit.register
+def _shutdown_executors():
+    """Shut down the pooled workers when the interpreter exits."""
+    with _executors_lock:
+        executors = list(_executors.values())
+        _executors.clear()
+    for executor in executors:
+        executor.shutdown(wait=False)
+
+
+def _run_assessment_task(task):
+    """
+    Run one assessment method in a worker process.
+
+    Module-level so it can be pickled by ProcessPoolExecutor. Each task is
+    ``(output_dir, use_numba, method_name, kwargs)``; every assessment seeds
+    its own MonteCarloSimulator, so results match a serial run exactly.
+    """
+    global _worker_processor
+    output_dir, use_numba, method_name, kwargs = task
+    if _worker_processor is None or _worker_processor.use_numba != use_numba:
+        _worker_processor = BatchProcessor(output_dir=output_dir, use_numba=use_numba)
+    return getattr(_worker_processor, method_name)(**kwargs)
+
+
 class BatchProcessor:
     """Main batch processing engine for QMRA assessments."""
 
-    def __init__(self, output_dir='outputs/results'):
-        """Initialize batch processor."""
+    def __init__(self, output_dir='outputs/results', use_numba=False):
+        """
+        Initialize batch processor.
+
+        Args:
+            output_dir: Directory for result files
+            use_numba: Use the compiled Hockey Stick and dose-response kernels
+                (qmra_core.fast_sampling); results match the default path.
+                Ignored, with a warning, when Numba is not installed.
+        """
         self.output_dir = Path(output_dir)
+        self.use_numba = resolve_use_numba(use_numba) if QMRA_MODULES_AVAILABLE else False
         self.output_dir.mkdir(parents=True, exist_ok=True)
 
         if QMRA_MODULES_AVAILABLE:
-            self.pathogen_db = PathogenDatabase()
+            # Shared per process: the parameter file is only parsed once
+            self.pathogen_db = get_pathogen_database()
         else:
             self.pathogen_db = None
 
         self.results_cache = []
 
+    def _infection_probability(self, dr_model, dose):
+        """Evaluate the dose-response model, using the compiled kernels when enabled."""
+        if self.use_numba and np.size(dose) >= KERNEL_MIN_DOSES:
+            # Discretized integer doses are a table lookup in the model,
+            # which is cheaper than evaluating lgamma even when compiled
+            if isinstance(dr_model, BetaBinomialModel) and np.asarray(dose).dtype.kind not in 'iu':
+                return beta_binomial_probability(dose, dr_model.parameters["alpha"],
+                                                 dr_model.parameters["beta"])
+            if isinstance(dr_model, BetaPoissonModel):
+                return beta_poisson_probability(dose, dr_model.parameters["alpha"],
+                                                dr_model.parameters["beta"])
+        return dr_model.calculate_infection_probability(dose)
+
+    def _map_assessments(self, method_name, kwargs_list, n_workers=1):
+        """
+        Run an assessment method once per kwargs dict, optionally in parallel.
+
+        Args:
+            method_name: Name of the BatchProcessor method to call
+            kwargs_list: List of keyword-argument dicts, one per assessment
+            n_workers: Worker processes (1 = run serially in this process,
+                None = one per CPU)
+
+        Returns:
+            List of results in the same order as kwargs_list
+        """
+        return list(self._imap_assessments(method_name, kwargs_list, n_workers))
+
+    def _imap_assessments(self, method_name, kwargs_list, n_workers=1):
+        """
+        Like ``_map_assessments`` but yield each result as soon as it is ready.
+
+        Results are still yielded in kwargs_list order.
+        """
+        if n_workers is None:
+            n_workers = os.cpu_count() or 1
+
+        if min(n_workers, len(kwargs_list)) <= 1:
+            method = getattr(self, method_name)
+            for kwargs in kwargs_list:
+                yield method(**kwargs)
+            return
+
+        tasks = [(str(self.output_dir), self.use_numba, method_name, kwargs)
+                 for kwargs in kwargs_list]
+        chunksize = max(1, len(tasks) // (4 * n_workers))
+        # The pool is sized by n_workers rather than the task count so that
+        # runs with few tasks (e.g. three pathogens) can reuse it too
+        executor = _get_executor(n_workers)
+        try:
+            yield from executor.map(_run_assessment_task, tasks, chunksize=chunksize)
+        except BrokenProcessPool:
+            _discard_executor(executor)
+            raise
+
     def run_spatial_assessment(self, dilution_file, pathogen, effluent_concentration=None,
                                exposure_route='primary_contact', volume_ml=50,
                                frequency_per_year=20, population=10000,
@@ -238,7 +434,7 @@ class BatchProcessor:
         # Save results
         if output_file:
             output_path = self.output_dir / output_file
-            results_df.to_csv(output_path, index=False)
+            save_results(results_df, output_path)
             print(f"\nResults saved to: {output_path}")
 
         return results_df
@@ -258,15 +454,13 @@ class BatchProcessor:
 
         # Get pathogen parameters
         pathogen_info = self.pathogen_db.get_pathogen_info(pathogen)
-        default_model_type = self.pathogen_db.get_default_model_type(pathogen)
-        dr_params = self.pathogen_db.get_dose_response_parameters(pathogen, default_model_type)
         health_data = self.pathogen_db.get_health_impact_data(pathogen)
 
         # Create dose-response model
-        dr_model = create_dose_response_model(default_model_type, dr_params)
+        dr_model = get_default_dose_response_model(pathogen)
 
         # Setup Monte Carlo simulator
-        mc_simulator = MonteCarloSimulator(random_seed=42)
+        mc_simulator = MonteCarloSimulator(random_seed=42, use_numba=self.use_numba)
 
         # Add pathogen concentration distribution
         if use_hockey_pathogen:
@@ -335,7 +529,7 @@ class BatchProcessor:
             dose_discretized = discretize_fractional_dose(dose, use_excel_method=True)
 
             # Calculate infection probability
-            infection_prob = dr_model.calculate_infection_probability(dose_discretized)
+            infection_prob = self._infection_probability(dr_model, dose_discretized)
 
             return infection_prob
 
@@ -456,7 +650,7 @@ class BatchProcessor:
         # Save results
         if output_file:
             output_path = self.output_dir / output_file
-            results_df.to_csv(output_path, index=False)
+            save_results(results_df, output_path)
             print(f"\nResults saved to: {output_path}")
 
         return results_df
@@ -466,7 +660,7 @@ class BatchProcessor:
                                  exposure_route='primary_contact',
                                  volume_ml=50, frequency_per_year=20,
                                  population=10000, iterations=10000,
-                                 output_file=None):
+                                 output_file=None, n_workers=1):
         """
         Compare multiple treatment scenarios.
 
@@ -478,6 +672,8 @@ class BatchProcessor:
             exposure_route, volume_ml, frequency_per_year, population: Exposure parameters
             iterations: Monte Carlo iterations
             output_file: Output file path
+            n_workers: Worker processes for the per-treatment Monte Carlo runs
+                (1 = serial, None = one per CPU)
 
         Returns:
             DataFrame with treatment comparison results
@@ -488,12 +684,12 @@ class BatchProcessor:
         print(f"Pathogen: {pathogen}")
         print(f"Raw concentration: {raw_concentration:,.0f} copies/L")
 
-        results = []
+        treatments = []
+        assessment_kwargs = []
 
         for treatment_file in treatment_files:
             # Load treatment configuration
-            with open(treatment_file, 'r') as f:
-                treatment_config = yaml.safe_load(f)
+            treatment_config = load_treatment_config(treatment_file)
 
             scenario_name = treatment_config['scenario_name']
             total_lrv = treatment_config['total_log_reduction']
@@ -506,8 +702,8 @@ class BatchProcessor:
             # Apply dilution
             receiving_water_conc = post_treatment_conc / dilution_factor
 
-            # Run QMRA
-            result = self._run_single_assessment(
+            treatments.append((treatment_config, post_treatment_conc, receiving_water_conc))
+            assessment_kwargs.append(dict(
                 pathogen=pathogen,
                 concentration=receiving_water_conc,
                 exposure_route=exposure_route,
@@ -515,7 +711,16 @@ class BatchProcessor:
                 frequency_per_year=frequency_per_year,
                 population=population,
                 iterations=iterations
-            )
+            ))
+
+        # Run QMRA for every treatment
+        assessments = self._map_assessments('_run_single_assessment', assessment_kwargs, n_workers)
+
+        results = []
+
+        for (treatment_config, post_treatment_conc, receiving_water_conc), result in zip(treatments, assessments):
+            scenario_name = treatment_config['scenario_name']
+            total_lrv = treatment_config['total_log_reduction']
 
             results.append({
                 'Treatment_Scenario': scenario_name,
@@ -532,14 +737,14 @@ class BatchProcessor:
                 'Risk_Reduction_vs_Raw': raw_concentration / receiving_water_conc
             })
 
-            print(f"  Annual Risk: {result['annual_risk_median']:.2e}  {results[-1]['Compliance_Status']}")
+            print(f"  {scenario_name}: Annual Risk {result['annual_risk_median']:.2e}  {results[-1]['Compliance_Status']}")
 
         results_df = pd.DataFrame(results)
 
         # Save results
         if output_file:
             output_path = self.output_dir / output_file
-            results_df.to_csv(output_path, index=False)
+            save_results(results_df, output_path)
             print(f"\nResults saved to: {output_path}")
 
         return results_df
@@ -549,7 +754,7 @@ class BatchProcessor:
                                       treatment_lrv=0, dilution_factor=100,
                                       volume_ml=50, frequency_per_year=20,
                                       population=10000, iterations=10000,
-                                      output_file=None):
+                                      output_file=None, n_workers=1):
         """
         Run assessment for multiple pathogens.
 
@@ -560,6 +765,8 @@ class BatchProcessor:
             volume_ml, frequency_per_year, population: Exposure parameters
             iterations: Monte Carlo iterations
             output_file: Output file path
+            n_workers: Worker processes for the per-pathogen Monte Carlo runs
+                (1 = serial, None = one per CPU)
 
         Returns:
             DataFrame with multi-pathogen comparison results
@@ -573,7 +780,8 @@ class BatchProcessor:
         conc_df = pd.read_csv(concentration_file)
         print(f"Loaded {len(conc_df)} samples")
 
-        results = []
+        assessed = []
+        assessment_kwargs = []
 
         for pathogen in pathogens:
             # Find concentration column
@@ -592,8 +800,8 @@ class BatchProcessor:
             post_treatment_conc = mean_concentration / (10 ** treatment_lrv)
             receiving_water_conc = post_treatment_conc / dilution_factor
 
-            # Run QMRA
-            result = self._run_single_assessment(
+            assessed.append((pathogen, mean_concentration, post_treatment_conc, receiving_water_conc))
+            assessment_kwargs.append(dict(
                 pathogen=pathogen,
                 concentration=receiving_water_conc,
                 exposure_route=exposure_route,
@@ -601,8 +809,14 @@ class BatchProcessor:
                 frequency_per_year=frequency_per_year,
                 population=population,
                 iterations=iterations
-            )
+            ))
+
+        # Run QMRA for every pathogen
+        assessments = self._map_assessments('_run_single_assessment', assessment_kwargs, n_workers)
+
+        results = []
 
+        for (pathogen, mean_concentration, post_treatment_conc, receiving_water_conc), result in zip(assessed, assessments):
             results.append({
                 'Pathogen': pathogen,
                 'Mean_Concentration': mean_concentration,
@@ -616,7 +830,7 @@ class BatchProcessor:
                 'Compliance_Status': 'COMPLIANT' if result['annual_risk_median'] <= 1e-4 else 'NON-COMPLIANT'
             })
 
-            print(f"  Annual Risk: {result['annual_risk_median']:.2e}  {results[-1]['Compliance_Status']}")
+            print(f"  {pathogen.title()}: Annual Risk {result['annual_risk_median']:.2e}  {results[-1]['Compliance_Status']}")
 
         results_df = pd.DataFrame(results)
         results_df = results_df.sort_values('Annual_Risk_Median', ascending=False)
@@ -624,7 +838,7 @@ class BatchProcessor:
         # Save results
         if output_file:
             output_path = self.output_dir / output_file
-            results_df.to_csv(output_path, index=False)
+            save_results(results_df, output_path)
             print(f"\nResults saved to: {output_path}")
 
         print(f"\nPathogen Risk Ranking:")
@@ -743,7 +957,7 @@ class BatchProcessor:
 
         # Save combined results
         output_file = output_path / 'batch_scenarios_results.csv'
-        results_df.to_csv(output_file, index=False)
+        save_results(results_df, output_file)
         print(f"\n{'='*80}")
         print(f"All results saved to: {output_file}")
         print(f"{'='*80}")
@@ -765,7 +979,7 @@ class BatchProcessor:
         return results_df
 
     def run_batch_scenarios_from_libraries(self, scenarios_file, dilution_data_file,
-                                           pathogen_data_file, output_dir=None):
+                                           pathogen_data_file, output_dir=None, n_workers=1):
         """
         Run batch scenarios using simplified three-file approach.
 
@@ -781,6 +995,8 @@ class BatchProcessor:
             dilution_data_file: CSV with dilution time-series data
             pathogen_data_file: CSV with pathogen Hockey Stick parameters
             output_dir: Directory for output files
+            n_workers: Worker processes for the per-scenario Monte Carlo runs
+                (1 = serial, None = one per CPU)
 
         Returns:
             DataFrame with all scenario results
@@ -789,6 +1005,55 @@ class BatchProcessor:
         print("BATCH SCENARIO EXECUTION (Simplified Approach)")
         print(f"{'='*80}")
 
+        if output_dir:
+            output_path = Path(output_dir)
+        else:
+            output_path = self.output_dir
+        output_path.mkdir(parents=True, exist_ok=True)
+
+        results = list(self.iter_batch_scenarios_from_libraries(
+            scenarios_file, dilution_data_file, pathogen_data_file, n_workers=n_workers))
+
+        results_df = pd.DataFrame(results)
+
+        # Save combined results
+        output_file = output_path / 'batch_scenarios_results.csv'
+        save_results(results_df, output_file)
+        print(f"\n{'='*80}")
+        print(f"All results saved to: {output_file}")
+        print(f"{'='*80}")
+
+        # Summary statistics
+        total_scenarios = len(results_df)
+        compliant = len(results_df[results_df['Compliance_Status'] == 'COMPLIANT'])
+
+        print(f"\nBatch Summary:")
+        print(f"  Total scenarios: {total_scenarios}")
+        print(f"  Compliant: {compliant} ({100*compliant/total_scenarios:.1f}%)")
+        print(f"  Non-compliant: {total_scenarios - compliant} ({100*(total_scenarios-compliant)/total_scenarios:.1f}%)")
+
+        return results_df
+
+    def iter_batch_scenarios_from_libraries(self, scenarios_file, dilution_data_file,
+                                            pathogen_data_file, n_workers=1):
+        """
+        Run library-based batch scenarios, yielding one result row at a time.
+
+        Streaming counterpart of ``run_batch_scenarios_from_libraries``: each
+        row is yielded as soon as its scenario finishes (in file order), so
+        callers can report progress or write rows out incrementally. Nothing
+        is saved to disk.
+
+        Args:
+            scenarios_file: CSV with scenario definitions
+            dilution_data_file: CSV with dilution time-series data
+            pathogen_data_file: CSV with pathogen Hockey Stick parameters
+            n_workers: Worker processes for the per-scenario Monte Carlo runs
+                (1 = serial, None = one per CPU)
+
+        Yields:
+            Dict with the results row for each scenario
+        """
         # Load data files
         print("\nLoading data files...")
         dilution_data = pd.read_csv(dilution_data_file)
@@ -803,13 +1068,16 @@ class BatchProcessor:
         unique_locations = dilution_data['Location'].unique()
         print(f"  Unique locations: {', '.join(unique_locations)}")
 
-        if output_dir:
-            output_path = Path(output_dir)
-        else:
-            output_path = self.output_dir
-        output_path.mkdir(parents=True, exist_ok=True)
+        # Index the libraries once instead of filtering them for every scenario
+        # (first row wins for duplicate Pathogen_IDs, as before)
+        pathogen_rows = pathogen_data.drop_duplicates('Pathogen_ID').set_index('Pathogen_ID', drop=False)
+        dilution_by_location = {
+            location: values.to_numpy()
+            for location, values in dilution_data.groupby('Location', sort=False)['Dilution_Factor']
+        }
 
-        results = []
+        scenario_inputs = []
+        assessment_kwargs = []
 
         for idx, scenario in scenarios_df.iterrows():
             scenario_id = scenario['Scenario_ID']
@@ -819,12 +1087,10 @@ class BatchProcessor:
 
             # Look up pathogen data by Pathogen_ID
             pathogen_id = scenario['Pathogen_ID']
-            pathogen_row = pathogen_data[pathogen_data['Pathogen_ID'] == pathogen_id]
-
-            if len(pathogen_row) == 0:
+            if pathogen_id not in pathogen_rows.index:
                 raise ValueError(f"Pathogen ID '{pathogen_id}' not found in pathogen data")
 
-            pathogen_row = pathogen_row.iloc[0]
+            pathogen_row = pathogen_rows.loc[pathogen_id]
             pathogen_type = pathogen_row['Pathogen_Type']
 
             # Get Hockey Stick parameters for pathogen
@@ -837,19 +1103,17 @@ class BatchProcessor:
 
             # Look up dilution data by Location
             location = scenario['Location']
-            location_dilution = dilution_data[dilution_data['Location'] == location]
-
-            if len(location_dilution) == 0:
+            if location not in dilution_by_location:
                 raise ValueError(f"Location '{location}' not found in dilution data")
 
             # Get all dilution values for this location (for ECDF)
-            dilution_values = location_dilution['Dilution_Factor'].values
+            dilution_values = dilution_by_location[location]
             dilution_median = np.median(dilution_values)
 
             print(f"    Location: {location} ({len(dilution_values)} dilution records, median={dilution_median:.1f}x)")
 
-            # Run QMRA with empirical distributions
-            result = self._run_assessment_with_distributions(
+            scenario_inputs.append((scenario, pathogen_type, pathogen_median, dilution_values, dilution_median))
+            assessment_kwargs.append(dict(
                 pathogen=pathogen_type,
                 dilution_values=dilution_values,
                 pathogen_min=pathogen_min,
@@ -865,14 +1129,19 @@ class BatchProcessor:
                 frequency_per_year=scenario['Exposure_Frequency_per_Year'],
                 population=scenario['Exposed_Population'],
                 iterations=scenario.get('Monte_Carlo_Iterations', 10000)
-            )
+            ))
 
-            results.append({
-                'Scenario_ID': scenario_id,
-                'Scenario_Name': scenario_name,
-                'Pathogen_ID': pathogen_id,
+        # Run QMRA with empirical distributions for every scenario
+        assessments = self._imap_assessments('_run_assessment_with_distributions',
+                                             assessment_kwargs, n_workers)
+
+        for (scenario, pathogen_type, pathogen_median, dilution_values, dilution_median), result in zip(scenario_inputs, assessments):
+            row = {
+                'Scenario_ID': scenario['Scenario_ID'],
+                'Scenario_Name': scenario['Scenario_Name'],
+                'Pathogen_ID': scenario['Pathogen_ID'],
                 'Pathogen': pathogen_type,
-                'Location': location,
+                'Location': scenario['Location'],
                 'Dilution_Median': dilution_median,
                 'Dilution_Min': np.min(dilution_values),
                 'Dilution_Max': np.max(dilution_values),
@@ -890,29 +1159,10 @@ class BatchProcessor:
                 'Population_Impact': result['population_impact'],
                 'Compliance_Status': 'COMPLIANT' if result['annual_risk_median'] <= 1e-4 else 'NON-COMPLIANT',
                 'Priority': scenario.get('Priority', 'Medium')
-            })
-
-            print(f"    Risk: {result['annual_risk_median']:.2e}  {results[-1]['Compliance_Status']}")
-
-        results_df = pd.DataFrame(results)
-
-        # Save combined results
-        output_file = output_path / 'batch_scenarios_results.csv'
-        results_df.to_csv(output_file, index=False)
-        print(f"\n{'='*80}")
-        print(f"All results saved to: {output_file}")
-        print(f"{'='*80}")
-
-        # Summary statistics
-        total_scenarios = len(results_df)
-        compliant = len(results_df[results_df['Compliance_Status'] == 'COMPLIANT'])
-
-        print(f"\nBatch Summary:")
-        print(f"  Total scenarios: {total_scenarios}")
-        print(f"  Compliant: {compliant} ({100*compliant/total_scenarios:.1f}%)")
-        print(f"  Non-compliant: {total_scenarios - compliant} ({100*(total_scenarios-compliant)/total_scenarios:.1f}%)")
+            }
 
-        return results_df
+            print(f"  {scenario['Scenario_ID']} Risk: {result['annual_risk_median']:.2e}  {row['Compliance_Status']}")
+            yield row
 
     def _run_assessment_with_distributions(self, pathogen, dilution_values,
                                             pathogen_min, pathogen_median, pathogen_max,
@@ -948,15 +1198,13 @@ class BatchProcessor:
 
         # Get pathogen parameters
         pathogen_info = self.pathogen_db.get_pathogen_info(pathogen)
-        default_model_type = self.pathogen_db.get_default_model_type(pathogen)
-        dr_params = self.pathogen_db.get_dose_response_parameters(pathogen, default_model_type)
         health_data = self.pathogen_db.get_health_impact_data(pathogen)
 
         # Create dose-response model
-        dr_model = create_dose_response_model(default_model_type, dr_params)
+        dr_model = get_default_dose_response_model(pathogen)
 
         # Setup Monte Carlo simulator
-        mc_simulator = MonteCarloSimulator(random_seed=42)
+        mc_simulator = MonteCarloSimulator(random_seed=42, use_numba=self.use_numba)
 
         # Add pathogen concentration as Hockey Stick distribution
         pathogen_dist = create_hockey_stick_distribution(
@@ -1010,7 +1258,7 @@ class BatchProcessor:
             dose_discretized = discretize_fractional_dose(dose, use_excel_method=True)
 
             # Calculate infection probability
-            infection_prob = dr_model.calculate_infection_probability(dose_discretized)
+            infection_prob = self._infection_probability(dr_model, dose_discretized)
 
             return infection_prob
 
@@ -1100,8 +1348,6 @@ class BatchProcessor:
         """
         # Get pathogen parameters
         pathogen_info = self.pathogen_db.get_pathogen_info(pathogen)
-        default_model_type = self.pathogen_db.get_default_model_type(pathogen)
-        dr_params = self.pathogen_db.get_dose_response_parameters(pathogen, default_model_type)
         health_data = self.pathogen_db.get_health_impact_data(pathogen)
 
         # Get illness parameters (with fallback to old method if not available)
@@ -1115,10 +1361,10 @@ class BatchProcessor:
             population_susceptibility = 1.0
 
         # Create dose-response model
-        dr_model = create_dose_response_model(default_model_type, dr_params)
+        dr_model = get_default_dose_response_model(pathogen)
 
         # Monte Carlo simulation
-        mc_simulator = MonteCarloSimulator(random_seed=42)
+        mc_simulator = MonteCarloSimulator(random_seed=42, use_numba=self.use_numba)
 
         # Add concentration distribution with custom CV and MHF adjustment
         # MHF: Method Harmonisation Factor converts between measurement methods
@@ -1177,7 +1423,7 @@ class BatchProcessor:
             from qmra_core.dose_response import discretize_fractional_dose
             dose_discretized = discretize_fractional_dose(dose, use_excel_method=True)
 
-            return dr_model.calculate_infection_probability(dose_discretized)
+            return self._infection_probability(dr_model, dose_discretized)
 
         # Run simulation
         infection_results = mc_simulator.run_simulation(
@@ -1203,25 +1449,32 @@ class BatchProcessor:
         annual_illness_samples = 1 - np.power(1 - illness_samples, frequency_per_year)
 
         # Calculate population illness cases
-        population_cases = population * np.mean(annual_illness_samples)
+        annual_illness_mean = np.mean(annual_illness_samples)
+        population_cases = population * annual_illness_mean
+
+        # One percentile pass per sample array, and each median computed once
+        pinf_5th, pinf_95th = np.percentile(pinf_samples, [5, 95])
+        pill_5th, pill_95th = np.percentile(illness_samples, [5, 95])
+        annual_5th, annual_95th = np.percentile(annual_infection_samples, [5, 95])
+        annual_infection_median = np.median(annual_infection_samples)
 
         return {
             'pinf_median': float(np.median(pinf_samples)),
             'pinf_mean': float(np.mean(pinf_samples)),
-            'pinf_5th': float(np.percentile(pinf_samples, 5)),
-            'pinf_95th': float(np.percentile(pinf_samples, 95)),
+            'pinf_5th': float(pinf_5th),
+            'pinf_95th': float(pinf_95th),
             'pill_median': float(np.median(illness_samples)),
             'pill_mean': float(np.mean(illness_samples)),
-            'pill_5th': float(np.percentile(illness_samples, 5)),
-            'pill_95th': float(np.percentile(illness_samples, 95)),
-            'annual_infection_median': float(np.median(annual_infection_samples)),
+            'pill_5th': float(pill_5th),
+            'pill_95th': float(pill_95th),
+            'annual_infection_median': float(annual_infection_median),
             'annual_illness_median': float(np.median(annual_illness_samples)),
-            'annual_risk_median': float(np.median(annual_infection_samples)),  # Keep for backwards compatibility
+            'annual_risk_median': float(annual_infection_median),  # Keep for backwards compatibility
             'annual_mean': float(np.mean(annual_infection_samples)),
-            'annual_5th': float(np.percentile(annual_infection_samples, 5)),
-            'annual_95th': float(np.percentile(annual_infection_samples, 95)),
-            'annual_illness_mean': float(np.mean(annual_illness_samples)),
-            'population_impact': int(population * np.median(annual_infection_samples)),
+            'annual_5th': float(annual_5th),
+            'annual_95th': float(annual_95th),
+            'annual_illness_mean': float(annual_illness_mean),
+            'population_impact': int(population * annual_infection_median),
             'population_illness_cases': float(population_cases),
             'p_illness_given_infection': float(p_illness_given_infection),
             'population_susceptibility': float(population_susceptibility),
@@ -12,19 +12,59 @@ Author: NIWA Earth Sciences New Zealand
 Date: October 2025
 """
 
+import os
 import streamlit as st
 import pandas as pd
 import numpy as np
-import matplotlib.pyplot as plt
+import importlib
+import importlib.util
 from pathlib import Path
 import io
 from datetime import datetime
+import hashlib
+import uuid
 import zipfile
-import tempfile
 
 # Import our modules
-from batch_processor import BatchProcessor
-from pdf_report_generator import QMRAPDFReportGenerator
+from batch_processor import BatchProcessor, NUMBA_AVAILABLE, save_results
+
+# On-screen previews are rasterized at a lower DPI than the print-quality
+# PNGs bundled for download (Agg cost grows with dpi squared)
+SCREEN_DPI = 150
+PRINT_DPI = 300
+
+# pyarrow parses CSVs multi-threaded, which only pays off for large results
+# tables without a Parquet copy; the small input files keep the C parser,
+# which starts faster and infers types the way the rest of the app expects
+RESULTS_CSV_ENGINE = 'pyarrow' if importlib.util.find_spec('pyarrow') is not None else 'c'
+
+# xlsxwriter writes workbooks several times faster than openpyxl
+EXCEL_ENGINE = 'xlsxwriter' if importlib.util.find_spec('xlsxwriter') is not None else 'openpyxl'
+
+# Every session shares the batch processor's worker pool, so cap it rather
+# than forking one worker per CPU from the Streamlit server
+BATCH_N_WORKERS = min(4, os.cpu_count() or 1)
+
+# Fragments (Streamlit >= 1.37) let a section rerun on its own; older
+# releases fall back to a plain call inside the full-page rerun
+fragment = getattr(st, 'fragment', None) or getattr(st, 'experimental_fragment', lambda func: func)
+
+# Matplotlib is only needed once results are plotted, so it is imported on
+# first use rather than on every cold start of the app
+_plt = None
+
+
+def _get_plt():
+    """Import and configure matplotlib.pyplot on first use."""
+    global _plt
+    if _plt is None:
+        # Figures are only ever rasterized to PNG, never shown in a window
+        importlib.import_module('matplotlib').use('Agg')
+        _plt = importlib.import_module('matplotlib.pyplot')
+        _plt.rcParams['path.simplify'] = True
+        _plt.rcParams['path.simplify_threshold'] = 1.0
+        _plt.rcParams['agg.path.chunksize'] = 10000
+    return _plt
 
 # Page configuration
 st.set_page_config(
@@ -78,9 +118,110 @@ st.markdown("""
 """, unsafe_allow_html=True)
 
 
+@st.cache_data(show_spinner=False)
+def _load_csv(path, mtime, engine='c'):
+    """Parse a CSV; ``mtime`` is only part of the cache key."""
+    return pd.read_csv(path, engine=engine)
+
+
+def file_mtime(path):
+    """Return a file's modification time, or None if it does not exist (one stat call)."""
+    try:
+        return Path(path).stat().st_mtime
+    except OSError:
+        return None
+
+
+def load_csv(path, mtime=None, engine='c'):
+    """
+    Read a CSV through the Streamlit cache, keyed on path and modification time.
+
+    Pass ``mtime`` (from ``file_mtime``) when it is already known to skip
+    another stat of the file.
+    """
+    if mtime is None:
+        mtime = Path(path).stat().st_mtime
+    return _load_csv(str(path), mtime, engine)
+
+
+@st.cache_data(show_spinner=False)
+def _load_parquet(path, mtime):
+    """Read a Parquet file; ``mtime`` is only part of the cache key."""
+    return pd.read_parquet(path)
+
+
+def load_results(path):
+    """
+    Load a results table, preferring the Parquet copy saved next to the CSV.
+
+    The sidecar is only used when it is at least as new as the CSV, so a
+    CSV edited or regenerated on its own is never shadowed by stale data.
+    """
+    path = Path(path)
+    parquet_path = path.with_suffix('.parquet')
+    if parquet_path.exists():
+        parquet_mtime = parquet_path.stat().st_mtime
+        if parquet_mtime >= path.stat().st_mtime:
+            return _load_parquet(str(parquet_path), parquet_mtime)
+    return load_csv(path, engine=RESULTS_CSV_ENGINE)
+
+
+@st.cache_data(show_spinner=False)
+def _load_preview(path, mtime, columns, rows):
+    """Slice the first rows of a cached CSV once per file version."""
+    return _load_csv(path, mtime)[list(columns)].head(rows).reset_index(drop=True)
+
+
+def load_preview(path, columns, rows=5, mtime=None):
+    """Return a small, cached preview of selected CSV columns for st.dataframe."""
+    if mtime is None:
+        mtime = Path(path).stat().st_mtime
+    return _load_preview(str(path), mtime, tuple(columns), rows)
+
+
+def top_k(df, column, k):
+    """
+    Return the ``k`` rows with the largest ``column`` values, largest first.
+
+    Like ``df.nlargest(k, column)`` (ties kept in row order) but NaNs are always
+    dropped, and rows are selected with ``np.argpartition`` instead of ordering
+    the column.
+    """
+    values = df[column].to_numpy(dtype=float)
+    candidates = np.flatnonzero(~np.isnan(values))
+    if k <= 0:
+        candidates = candidates[:0]
+    elif len(candidates) > k:
+        candidates = np.sort(candidates[np.argpartition(values[candidates], -k)[-k:]])
+    order = np.argsort(-values[candidates], kind='stable')
+    return df.iloc[candidates[order]]
+
+
+def set_scenario_yticks(ax, df_sorted, fontsize=9):
+    """
+    Label one y-tick per bar with the scenario names.
+
+    Uses a FixedLocator/FixedFormatter pair and no minor ticks, so Matplotlib
+    lays out exactly one label per scenario.
+    """
+    from matplotlib.ticker import FixedFormatter, FixedLocator, NullLocator
+
+    # Use Scenario_Name if available, otherwise number the scenarios
+    if 'Scenario_Name' in df_sorted.columns:
+        labels = df_sorted['Scenario_Name'].astype(str).to_numpy()
+    else:
+        labels = [f"Scenario {i+1}" for i in range(len(df_sorted))]
+
+    ax.yaxis.set_major_locator(FixedLocator(np.arange(len(labels))))
+    ax.yaxis.set_major_formatter(FixedFormatter(labels))
+    ax.yaxis.set_minor_locator(NullLocator())
+    ax.tick_params(axis='y', labelsize=fontsize)
+
+
 # Plotting helper functions
 def create_risk_overview_plot(df):
     """Create horizontal bar chart of risk by scenario."""
+    plt = _get_plt()
     fig, ax = plt.subplots(figsize=(12, max(6, len(df) * 0.3)))
 
     # Check if required columns exist
@@ -94,19 +235,13 @@ def create_risk_overview_plot(df):
 
     # Set colors based on Compliance_Status if available
     if 'Compliance_Status' in df.columns:
-        colors = ['#28a745' if s == 'COMPLIANT' else '#dc3545'
-                 for s in df_sorted['Compliance_Status']]
+        colors = np.where(df_sorted['Compliance_Status'].to_numpy() == 'COMPLIANT',
+                          '#28a745', '#dc3545')
     else:
         colors = '#1f77b4'  # Default blue color
 
     ax.barh(range(len(df_sorted)), df_sorted['Annual_Risk_Median'], color=colors, alpha=0.7)
-    ax.set_yticks(range(len(df_sorted)))
-
-    # Use Scenario_Name if available, otherwise use index
-    if 'Scenario_Name' in df_sorted.columns:
-        ax.set_yticklabels(df_sorted['Scenario_Name'], fontsize=9)
-    else:
-        ax.set_yticklabels([f"Scenario {i+1}" for i in range(len(df_sorted))], fontsize=9)
+    set_scenario_yticks(ax, df_sorted)
 
     ax.set_xlabel('Annual Infection Risk (Median)', fontsize=12, fontweight='bold')
     ax.set_title('Risk Overview by Scenario', fontsize=14, fontweight='bold', pad=20)
@@ -121,6 +256,7 @@ def create_risk_overview_plot(df):
 
 def create_compliance_plot(df):
     """Create pie chart of compliance status."""
+    plt = _get_plt()
     fig, ax = plt.subplots(figsize=(8, 8))
 
     if 'Compliance_Status' not in df.columns:
@@ -155,6 +291,7 @@ def create_compliance_plot(df):
 
 def create_risk_distribution_plot(df):
     """Create histogram of risk distribution."""
+    plt = _get_plt()
     fig, (ax1, ax2) = plt.subplots(1, 2, figsize=(14, 6))
 
     if 'Annual_Risk_Median' not in df.columns:
@@ -165,14 +302,26 @@ def create_risk_distribution_plot(df):
         plt.tight_layout()
         return fig
 
-    # Histogram
-    ax1.hist(np.log10(df['Annual_Risk_Median']), bins=20, color='steelblue', alpha=0.7, edgecolor='black')
-    ax1.set_xlabel('Log10(Annual Risk)', fontsize=12, fontweight='bold')
-    ax1.set_ylabel('Frequency', fontsize=12, fontweight='bold')
-    ax1.set_title('Risk Distribution (Histogram)', fontsize=13, fontweight='bold')
-    ax1.axvline(x=np.log10(1e-4), color='orange', linestyle='--', linewidth=2, label='WHO Threshold')
-    ax1.legend()
-    ax1.grid(True, alpha=0.3)
+    # Histogram on a log axis - only positive risks can be placed on it
+    risk_values = df['Annual_Risk_Median'].to_numpy()
+    valid_risks = risk_values[risk_values > 0]
+
+    if len(valid_risks) > 0:
+        log_min, log_max = np.log10(valid_risks.min()), np.log10(valid_risks.max())
+        if log_min == log_max:
+            log_min, log_max = log_min - 0.5, log_max + 0.5
+        bins = np.logspace(log_min, log_max, 21)
+        ax1.hist(valid_risks, bins=bins, color='steelblue', alpha=0.7, edgecolor='black')
+        ax1.set_xscale('log')
+        ax1.set_xlabel('Annual Risk (log scale)', fontsize=12, fontweight='bold')
+        ax1.set_ylabel('Frequency', fontsize=12, fontweight='bold')
+        ax1.set_title('Risk Distribution (Histogram)', fontsize=13, fontweight='bold')
+        ax1.axvline(x=1e-4, color='orange', linestyle='--', linewidth=2, label='WHO Threshold')
+        ax1.legend()
+        ax1.grid(True, alpha=0.3)
+    else:
+        ax1.text(0.5, 0.5, 'No valid risk values to plot',
+                ha='center', va='center', fontsize=14, transform=ax1.transAxes)
 
     # Box plot by risk classification
     if 'Risk_Classification' in df.columns:
@@ -199,6 +348,7 @@ def create_risk_distribution_plot(df):
 
 def create_population_impact_plot(df):
     """Create population impact visualization."""
+    plt = _get_plt()
     fig, (ax1, ax2) = plt.subplots(1, 2, figsize=(14, 6))
 
     if 'Population_Impact' not in df.columns:
@@ -210,18 +360,12 @@ def create_population_impact_plot(df):
         return fig
 
     # Bar chart of population impact
-    df_sorted = df.nlargest(15, 'Population_Impact')
-    colors = ['#dc3545' if impact > 1000 else '#ffc107' if impact > 100 else '#28a745'
-             for impact in df_sorted['Population_Impact']]
+    df_sorted = top_k(df, 'Population_Impact', 15)
+    impact = df_sorted['Population_Impact'].to_numpy()
+    colors = np.select([impact > 1000, impact > 100], ['#dc3545', '#ffc107'], default='#28a745')
 
     ax1.barh(range(len(df_sorted)), df_sorted['Population_Impact'], color=colors, alpha=0.7)
-    ax1.set_yticks(range(len(df_sorted)))
-
-    # Use Scenario_Name if available
-    if 'Scenario_Name' in df_sorted.columns:
-        ax1.set_yticklabels(df_sorted['Scenario_Name'], fontsize=9)
-    else:
-        ax1.set_yticklabels([f"Scenario {i+1}" for i in range(len(df_sorted))], fontsize=9)
+    set_scenario_yticks(ax1, df_sorted)
 
     ax1.set_xlabel('Expected Annual Illnesses', fontsize=12, fontweight='bold')
     ax1.set_title('Top 15 Scenarios by Population Impact', fontsize=13, fontweight='bold')
@@ -249,7 +393,7 @@ def create_population_impact_plot(df):
     return fig
 
 
-def fig_to_bytes(fig, dpi=300):
+def fig_to_bytes(fig, dpi=PRINT_DPI):
     """Convert matplotlib figure to bytes for download."""
     buf = io.BytesIO()
     fig.savefig(buf, format='png', dpi=dpi, bbox_inches='tight')
@@ -257,8 +401,87 @@ def fig_to_bytes(fig, dpi=300):
     return buf.getvalue()
 
 
-def create_summary_statistics(df):
+PLOT_BUILDERS = {
+    'risk_overview': create_risk_overview_plot,
+    'compliance_distribution': create_compliance_plot,
+    'risk_distribution': create_risk_distribution_plot,
+    'population_impact': create_population_impact_plot,
+}
+
+
+def dataframe_digest(df):
+    """Stable content hash of a results DataFrame, used as a cache key."""
+    row_hashes = pd.util.hash_pandas_object(df, index=True).values
+    return hashlib.sha1(row_hashes.tobytes()).hexdigest()
+
+
+@st.cache_data(show_spinner=False)
+def render_plot_png(plot_name, df_digest, _df, dpi=SCREEN_DPI):
+    """
+    Render one of the results plots to PNG bytes.
+
+    Cached on ``(plot_name, df_digest, dpi)`` so Streamlit reruns on unchanged
+    results reuse the bitmap instead of rebuilding the Matplotlib figure.
+    ``_df`` is excluded from Streamlit's argument hashing.
+    """
+    fig = PLOT_BUILDERS[plot_name](_df)
+    png = fig_to_bytes(fig, dpi=dpi)
+    fig.clear()
+    _get_plt().close(fig)
+    return png
+
+
+def render_print_plots(df_digest, df):
+    """Return every plot as print-resolution PNG bytes, keyed by plot name."""
+    return {name: render_plot_png(name, df_digest, df, dpi=PRINT_DPI) for name in PLOT_BUILDERS}
+
+
+def compute_summary_metrics(df):
+    """
+    Compute the headline statistics shared by the summary table and ZIP README.
+
+    Each column is scanned once (``value_counts`` / ``agg``) rather than
+    filtering the frame separately for every metric.
+    """
+    compliance = (df['Compliance_Status'].value_counts()
+                  if 'Compliance_Status' in df.columns else pd.Series(dtype=int))
+    classification = (df['Risk_Classification'].value_counts()
+                      if 'Risk_Classification' in df.columns else None)
+
+    if 'Annual_Risk_Median' in df.columns:
+        risk_stats = df['Annual_Risk_Median'].agg(['mean', 'median', 'min', 'max'])
+    else:
+        risk_stats = pd.Series(0.0, index=['mean', 'median', 'min', 'max'])
+
+    if 'Population_Impact' in df.columns:
+        impact_stats = df['Population_Impact'].agg(['sum', 'mean'])
+    else:
+        impact_stats = pd.Series(0.0, index=['sum', 'mean'])
+
+    return {
+        'total': len(df),
+        'compliant': int(compliance.get('COMPLIANT', 0)),
+        'non_compliant': int(compliance.get('NON-COMPLIANT', 0)),
+        'risk_mean': risk_stats['mean'],
+        'risk_median': risk_stats['median'],
+        'risk_min': risk_stats['min'],
+        'risk_max': risk_stats['max'],
+        'impact_total': impact_stats['sum'],
+        'impact_mean': impact_stats['mean'],
+        'classification_counts': classification,
+    }
+
+
+def create_summary_statistics(df, metrics=None):
     """Create summary statistics table."""
+    if metrics is None:
+        metrics = compute_summary_metrics(df)
+
+    classification = metrics['classification_counts']
+
+    def class_count(level):
+        return int(classification.get(level, 0)) if classification is not None else 'N/A'
+
     summary = pd.DataFrame({
         'Metric': [
             'Total Scenarios',
@@ -275,64 +498,132 @@ def create_summary_statistics(df):
             'Scenarios with Low Risk Classification'
         ],
         'Value': [
-            len(df),
-            len(df[df['Compliance_Status'] == 'COMPLIANT']),
-            len(df[df['Compliance_Status'] == 'NON-COMPLIANT']),
-            f"{df['Annual_Risk_Median'].mean():.2e}",
-            f"{df['Annual_Risk_Median'].median():.2e}",
-            f"{df['Annual_Risk_Median'].min():.2e}",
-            f"{df['Annual_Risk_Median'].max():.2e}",
-            f"{df['Population_Impact'].sum():.0f}",
-            f"{df['Population_Impact'].mean():.1f}",
-            len(df[df['Risk_Classification'] == 'High']) if 'Risk_Classification' in df.columns else 'N/A',
-            len(df[df['Risk_Classification'] == 'Medium']) if 'Risk_Classification' in df.columns else 'N/A',
-            len(df[df['Risk_Classification'] == 'Low']) if 'Risk_Classification' in df.columns else 'N/A'
+            metrics['total'],
+            metrics['compliant'],
+            metrics['non_compliant'],
+            f"{metrics['risk_mean']:.2e}",
+            f"{metrics['risk_median']:.2e}",
+            f"{metrics['risk_min']:.2e}",
+            f"{metrics['risk_max']:.2e}",
+            f"{metrics['impact_total']:.0f}",
+            f"{metrics['impact_mean']:.1f}",
+            class_count('High'),
+            class_count('Medium'),
+            class_count('Low')
         ]
     })
 
     return summary
 
 
-def create_zip_bundle(df, plots, results_file):
-    """Create ZIP file containing all results, plots, and tables."""
+def build_result_tables(df):
+    """
+    Split a results DataFrame into the downloadable table subsets.
+
+    Returns a dict keyed by table name (the CSV stem used in the downloads
+    and ZIP bundle); subsets that do not apply or are empty are omitted.
+    """
+    tables = {}
+
+    if 'Risk_Classification' in df.columns:
+        high_risk_mask = np.isin(df['Risk_Classification'].to_numpy(), ['High', 'Medium'])
+        if high_risk_mask.any():
+            tables['high_risk_scenarios'] = df[high_risk_mask]
+
+    if 'Compliance_Status' in df.columns:
+        # Compare the status column once as a plain array and reuse the masks
+        status = df['Compliance_Status'].to_numpy()
+        comp_mask = status == 'COMPLIANT'
+        non_comp_mask = status == 'NON-COMPLIANT'
+
+        if comp_mask.any():
+            tables['compliant_scenarios'] = df[comp_mask]
+
+        if non_comp_mask.any():
+            tables['non_compliant_scenarios'] = df[non_comp_mask]
+
+    if 'Annual_Risk_Median' in df.columns:
+        tables['top_10_highest_risk'] = top_k(df, 'Annual_Risk_Median', 10)
+
+    return tables
+
+
+@st.cache_data(show_spinner=False)
+def result_tables(df_digest, _df):
+    """
+    Cached summary metrics, summary table and table subsets for one run.
+
+    Keyed on the DataFrame digest like ``render_plot_png`` so reruns of the
+    results page (widget clicks, downloads) reuse the filtered slices.
+    """
+    metrics = compute_summary_metrics(_df)
+    return metrics, create_summary_statistics(_df, metrics), build_result_tables(_df)
+
+
+@st.cache_data(show_spinner=False)
+def csv_download_bytes(df_digest, table_name, _table_df, index=False):
+    """Cached CSV bytes for one table of a run; ``table_name`` keeps the tables apart."""
+    return _table_df.to_csv(index=index).encode('utf-8')
+
+
+@st.cache_data(show_spinner=False)
+def excel_workbook_bytes(df_digest, _df, _tables):
+    """Cached Excel workbook (results, summary, high-risk sheets) for one run."""
+    _, summary_df, subsets = _tables
+    excel_buffer = io.BytesIO()
+    with pd.ExcelWriter(excel_buffer, engine=EXCEL_ENGINE) as writer:
+        _df.to_excel(writer, sheet_name='All Results', index=False)
+        summary_df.to_excel(writer, sheet_name='Summary Statistics')
+        if 'high_risk_scenarios' in subsets:
+            subsets['high_risk_scenarios'].to_excel(writer, sheet_name='High Risk', index=False)
+    return excel_buffer.getvalue()
+
+
+def write_csv_to_zip(zip_file, name, df, index=False):
+    """Stream a DataFrame as CSV straight into a ZIP member."""
+    with zip_file.open(name, 'w', force_zip64=True) as member:
+        with io.TextIOWrapper(member, encoding='utf-8', newline='') as text:
+            df.to_csv(text, index=index)
+
+
+def create_zip_bundle(df, plots, results_file, tables=None):
+    """
+    Create ZIP file containing all results, plots, and tables.
+
+    ``plots`` maps plot name to rendered PNG bytes (see ``render_plot_png``);
+    ``tables`` is the ``(metrics, summary_df, subsets)`` tuple returned by
+    ``result_tables`` and is computed from ``df`` when omitted.
+    CSVs are written through the deflate stream one table at a time rather
+    than materialized as strings first. Returns a BytesIO rewound to the
+    start, which ``st.download_button`` accepts directly (it does not take
+    arbitrary file objects such as a SpooledTemporaryFile).
+    """
     zip_buffer = io.BytesIO()
 
     with zipfile.ZipFile(zip_buffer, 'w', zipfile.ZIP_DEFLATED) as zip_file:
         # Add main CSV
-        zip_file.writestr('results_full.csv', df.to_csv(index=False))
-
-        # Add individual table subsets (with safe column checking)
-        if 'Risk_Classification' in df.columns:
-            high_risk_df = df[df['Risk_Classification'].isin(['High', 'Medium'])]
-            if len(high_risk_df) > 0:
-                zip_file.writestr('tables/high_risk_scenarios.csv', high_risk_df.to_csv(index=False))
+        write_csv_to_zip(zip_file, 'results_full.csv', df)
 
-        if 'Compliance_Status' in df.columns:
-            compliant_df = df[df['Compliance_Status'] == 'COMPLIANT']
-            if len(compliant_df) > 0:
-                zip_file.writestr('tables/compliant_scenarios.csv', compliant_df.to_csv(index=False))
+        if tables is None:
+            metrics = compute_summary_metrics(df)
+            tables = (metrics, create_summary_statistics(df, metrics), build_result_tables(df))
+        metrics, summary_df, subsets = tables
 
-            non_compliant_df = df[df['Compliance_Status'] == 'NON-COMPLIANT']
-            if len(non_compliant_df) > 0:
-                zip_file.writestr('tables/non_compliant_scenarios.csv', non_compliant_df.to_csv(index=False))
+        # Add individual table subsets (only those that apply to this run)
+        for table_name, table_df in subsets.items():
+            write_csv_to_zip(zip_file, f'tables/{table_name}.csv', table_df)
 
-        top_risk_df = df.nlargest(10, 'Annual_Risk_Median')
-        zip_file.writestr('tables/top_10_highest_risk.csv', top_risk_df.to_csv(index=False))
-
-        summary_df = create_summary_statistics(df)
-        zip_file.writestr('tables/summary_statistics.csv', summary_df.to_csv(index=True))
+        write_csv_to_zip(zip_file, 'tables/summary_statistics.csv', summary_df, index=True)
 
         # Add plots
-        for plot_name, fig in plots.items():
-            plot_bytes = fig_to_bytes(fig, dpi=300)
+        for plot_name, plot_bytes in plots.items():
             zip_file.writestr(f'plots/{plot_name}.png', plot_bytes)
 
         # Add README
-        # Generate summary statistics for README
-        compliant_count = len(df[df['Compliance_Status'] == 'COMPLIANT']) if 'Compliance_Status' in df.columns else 0
-        non_compliant_count = len(df[df['Compliance_Status'] == 'NON-COMPLIANT']) if 'Compliance_Status' in df.columns else 0
-        mean_risk = df['Annual_Risk_Median'].mean() if 'Annual_Risk_Median' in df.columns else 0
-        total_impact = df['Population_Impact'].sum() if 'Population_Impact' in df.columns else 0
+        compliant_count = metrics['compliant']
+        non_compliant_count = metrics['non_compliant']
+        mean_risk = metrics['risk_mean']
+        total_impact = metrics['impact_total']
 
         readme_content = f"""QMRA Batch Assessment Results Package
 ========================================
@@ -371,7 +662,14 @@ QMRA Batch Processing Tool v1.0
         zip_file.writestr('README.txt', readme_content)
 
     zip_buffer.seek(0)
-    return zip_buffer.getvalue()
+    return zip_buffer
+
+
+@st.cache_data(show_spinner=False)
+def zip_bundle_bytes(df_digest, results_file, _df, _tables):
+    """Cached ZIP bundle bytes for one results run (see ``create_zip_bundle``)."""
+    plots = render_print_plots(df_digest, _df)
+    return create_zip_bundle(_df, plots, results_file, _tables).getvalue()
 
 
 def main():
@@ -384,10 +682,9 @@ def main():
     # Sidebar
     with st.sidebar:
         st.image("niwa_logo.png", use_container_width=True)
-        st.markdown("---")
 
         # Production Mode Configuration
-        st.markdown("### 🔧 Configuration")
+        st.markdown("---\n\n### 🔧 Configuration")
         production_mode = st.checkbox(
             "Production Mode (Norovirus Only)",
             value=True,
@@ -401,17 +698,14 @@ def main():
             st.warning("⚠️ **Research Mode Active**\n\nOther pathogens available but may require additional validation. Norovirus uses validated Beta-Binomial model.")
             available_pathogens = ["norovirus", "campylobacter", "cryptosporidium", "e_coli", "rotavirus", "salmonella"]
 
-        st.markdown("---")
-
-        st.markdown("### Assessment Mode")
+        st.markdown("---\n\n### Assessment Mode")
         assessment_mode = st.selectbox(
             "Select batch processing type:",
             ["Batch Scenarios", "Spatial Assessment", "Temporal Assessment",
              "Treatment Comparison", "Multi-Pathogen Assessment"]
         )
 
-        st.markdown("---")
-        st.markdown("### About")
+        st.markdown("---\n\n### About")
         st.info("""
         **QMRA Batch Processing Tool**
 
@@ -441,23 +735,26 @@ def main():
         multi_pathogen_page()
 
 
-def batch_scenarios_page():
-    """Batch scenarios assessment page."""
-    st.markdown('<div class="sub-header">📋 Batch Scenario Processing</div>', unsafe_allow_html=True)
+# Static intro for the batch page; header and text go out as one element
+BATCH_PAGE_INTRO = """<div class="sub-header">📋 Batch Scenario Processing</div>
+
+Run multiple pre-configured scenarios using **three simple data files**:
+- 🌊 **Dilution Data**: Time, Location, Dilution_Factor (empirical from hydrodynamic models)
+- 🦠 **Pathogen Data**: Hockey Stick distribution (X₀, X₅₀, X₁₀₀, P) parameters
+- 📋 **Scenarios**: All scenario parameters (references Location & Pathogen_ID)
+
+**Key Feature**: Hockey Stick Distribution (McBride 2009)
+- Realistic right-skewed distribution for environmental pathogens
+- P parameter controls tail behavior (default 0.95 for 95th percentile breakpoint)
+- Empirical ECDF for dilution factors from actual modeling output
 
-    st.markdown("""
-    Run multiple pre-configured scenarios using **three simple data files**:
-    - 🌊 **Dilution Data**: Time, Location, Dilution_Factor (empirical from hydrodynamic models)
-    - 🦠 **Pathogen Data**: Hockey Stick distribution (X₀, X₅₀, X₁₀₀, P) parameters
-    - 📋 **Scenarios**: All scenario parameters (references Location & Pathogen_ID)
+**Benefits**: Simple, straightforward, empirical distributions with statistical rigor
+"""
 
-    **Key Feature**: Hockey Stick Distribution (McBride 2009)
-    - Realistic right-skewed distribution for environmental pathogens
-    - P parameter controls tail behavior (default 0.95 for 95th percentile breakpoint)
-    - Empirical ECDF for dilution factors from actual modeling output
 
-    **Benefits**: Simple, straightforward, empirical distributions with statistical rigor
-    """)
+def batch_scenarios_page():
+    """Batch scenarios assessment page."""
+    st.markdown(BATCH_PAGE_INTRO, unsafe_allow_html=True)
 
     # Tabs
     tab1, tab2, tab3 = st.tabs(["📁 Input Data", "▶️ Run Assessment", "📊 Results & Reports"])
@@ -480,30 +777,35 @@ def batch_scenarios_page():
             with col1:
                 st.markdown("**Dilution Data**")
                 st.caption("Time-series from models")
-                if Path(dilution_file).exists():
-                    df_dil = pd.read_csv(dilution_file)
-                    st.dataframe(df_dil[['Time', 'Location', 'Dilution_Factor']].head(5),
+                dilution_mtime = file_mtime(dilution_file)
+                if dilution_mtime is not None:
+                    df_dil = load_csv(dilution_file, dilution_mtime)
+                    st.dataframe(load_preview(dilution_file, ['Time', 'Location', 'Dilution_Factor'],
+                                              mtime=dilution_mtime),
                                use_container_width=True, height=200)
                     st.caption(f"{len(df_dil)} records, {df_dil['Location'].nunique()} locations")
 
             with col2:
                 st.markdown("**Pathogen Data**")
                 st.caption("Hockey Stick parameters (X0, X50, X100, P)")
-                if Path(pathogen_file).exists():
-                    df_path = pd.read_csv(pathogen_file)
+                pathogen_mtime = file_mtime(pathogen_file)
+                if pathogen_mtime is not None:
+                    df_path = load_csv(pathogen_file, pathogen_mtime)
                     cols_to_show = ['Pathogen_ID', 'Pathogen_Type', 'Median_Concentration', 'P_Breakpoint'] \
                                    if 'P_Breakpoint' in df_path.columns \
                                    else ['Pathogen_ID', 'Pathogen_Type', 'Median_Concentration']
-                    st.dataframe(df_path[cols_to_show].head(5),
+                    st.dataframe(load_preview(pathogen_file, cols_to_show, mtime=pathogen_mtime),
                                use_container_width=True, height=200)
                     st.caption(f"{len(df_path)} pathogens")
 
             with col3:
                 st.markdown("**Scenarios**")
                 st.caption("All scenario parameters")
-                if Path(scenario_file).exists():
-                    df_scen = pd.read_csv(scenario_file)
-                    st.dataframe(df_scen[['Scenario_ID', 'Scenario_Name', 'Pathogen_ID', 'Location']].head(5),
+                scenario_mtime = file_mtime(scenario_file)
+                if scenario_mtime is not None:
+                    df_scen = load_csv(scenario_file, scenario_mtime)
+                    st.dataframe(load_preview(scenario_file, ['Scenario_ID', 'Scenario_Name', 'Pathogen_ID', 'Location'],
+                                              mtime=scenario_mtime),
                                use_container_width=True, height=200)
                     st.caption(f"{len(df_scen)} scenarios")
 
@@ -518,7 +820,7 @@ def batch_scenarios_page():
                 dilution_upload = st.file_uploader("Upload dilution_data.csv", type=['csv'], key='dilution')
                 if dilution_upload:
                     dilution_file = save_uploaded_file(dilution_upload)
-                    df_dil = pd.read_csv(dilution_file)
+                    df_dil = load_csv(dilution_file)
                     st.success(f"✓ {len(df_dil)} records")
                 else:
                     dilution_file = None
@@ -529,7 +831,7 @@ def batch_scenarios_page():
                 pathogen_upload = st.file_uploader("Upload pathogen_data.csv", type=['csv'], key='pathogen')
                 if pathogen_upload:
                     pathogen_file = save_uploaded_file(pathogen_upload)
-                    df_path = pd.read_csv(pathogen_file)
+                    df_path = load_csv(pathogen_file)
                     st.success(f"✓ {len(df_path)} pathogens")
                 else:
                     pathogen_file = None
@@ -540,7 +842,7 @@ def batch_scenarios_page():
                 scenario_upload = st.file_uploader("Upload scenarios.csv", type=['csv'], key='scenarios')
                 if scenario_upload:
                     scenario_file = save_uploaded_file(scenario_upload)
-                    df_scen = pd.read_csv(scenario_file)
+                    df_scen = load_csv(scenario_file)
                     st.success(f"✓ {len(df_scen)} scenarios")
                 else:
                     scenario_file = None
@@ -620,11 +922,16 @@ def batch_scenarios_page():
                                                value=f"batch_results_{datetime.now().strftime('%Y%m%d_%H%M%S')}")
 
                     iterations = st.slider("Monte Carlo iterations:", 1000, 50000, 10000, 1000)
+                    use_numba = st.checkbox("Use compiled sampling (Numba)", value=NUMBA_AVAILABLE,
+                                            disabled=not NUMBA_AVAILABLE,
+                                            help="Runs Hockey Stick sampling and Beta-Binomial / Beta-Poisson dose-response "
+                                                 "through compiled kernels. Requires the optional numba package.")
 
                 with col2:
                     st.markdown("**Actions:**")
                     if st.button("🚀 Run Batch Assessment", type="primary", use_container_width=True):
-                        run_batch_assessment_library(scenario_file, dilution_file, pathogen_file, output_name, iterations)
+                        run_batch_assessment_library(scenario_file, dilution_file, pathogen_file, output_name,
+                                                     iterations, use_numba=use_numba)
             else:
                 st.warning("⚠️ One or more files are missing. Please check the Input Data tab.")
 
@@ -892,25 +1199,48 @@ def multi_pathogen_page():
     display_results_and_reports()
 
 
+def store_results(results_file, results_df, assessment):
+    """
+    Remember a finished assessment for the results tab.
+
+    The returned DataFrame is kept in ``st.session_state`` under a fresh run
+    id, so reruns (tab switches, slider moves) reuse it instead of parsing the
+    CSV again. A new assessment replaces it and changes the run id.
+    """
+    st.session_state['last_results'] = results_file
+    st.session_state['last_assessment'] = assessment
+    st.session_state['results_df'] = results_df.reset_index(drop=True)
+    st.session_state['run_id'] = uuid.uuid4().hex
+
+
 # Processing functions
-def run_batch_assessment_library(scenario_file, dilution_file, pathogen_file, output_name, iterations):
+def run_batch_assessment_library(scenario_file, dilution_file, pathogen_file, output_name, iterations,
+                                 use_numba=False):
     """Run batch scenario assessment using library-based approach."""
     with st.spinner("🔄 Processing batch scenarios from libraries..."):
         try:
-            processor = BatchProcessor(output_dir='outputs/results')
-
-            # Run using simplified three-file method
-            results = processor.run_batch_scenarios_from_libraries(
+            processor = BatchProcessor(output_dir='outputs/results', use_numba=use_numba)
+            n_scenarios = len(load_csv(scenario_file))
+            progress = st.progress(0.0, text=f"Running {n_scenarios} scenarios...")
+
+            # Run using simplified three-file method, streaming rows so the
+            # progress bar advances as each scenario finishes
+            rows = []
+            for row in processor.iter_batch_scenarios_from_libraries(
                 scenarios_file=scenario_file,
                 dilution_data_file=dilution_file,
                 pathogen_data_file=pathogen_file,
-                output_dir='outputs/results'
-            )
-
+                n_workers=BATCH_N_WORKERS
+            ):
+                rows.append(row)
+                progress.progress(min(len(rows) / n_scenarios, 1.0),
+                                  text=f"Completed {len(rows)}/{n_scenarios} scenarios")
+            progress.empty()
+
+            results = pd.DataFrame(rows)
             output_csv = "outputs/results/batch_scenarios_results.csv"
-
-            st.session_state['last_results'] = output_csv
-            st.session_state['last_assessment'] = 'batch'
+            save_results(results, output_csv, write_parquet=True)
+            store_results(output_csv, results, 'batch')
 
             st.success("✅ Batch assessment complete!")
             st.balloons()
@@ -933,9 +1263,7 @@ def run_batch_assessment(scenario_file, output_name, iterations):
             )
 
             output_csv = f"outputs/results/batch_scenarios_results.csv"
-
-            st.session_state['last_results'] = output_csv
-            st.session_state['last_assessment'] = 'batch'
+            store_results(output_csv, results, 'batch')
 
             st.success("✅ Batch assessment complete!")
             st.balloons()
@@ -966,8 +1294,7 @@ def run_spatial_assessment(dilution_file, pathogen, concentration, exposure_rout
                 output_file=f"{output_name}.csv"
             )
 
-            st.session_state['last_results'] = f"outputs/results/{output_name}.csv"
-            st.session_state['last_assessment'] = 'spatial'
+            store_results(f"outputs/results/{output_name}.csv", results, 'spatial')
 
             st.success("✅ Spatial assessment complete!")
 
@@ -996,8 +1323,7 @@ def run_temporal_assessment(monitoring_file, pathogen, exposure_route, treatment
                 output_file=f"{output_name}.csv"
             )
 
-            st.session_state['last_results'] = f"outputs/results/{output_name}.csv"
-            st.session_state['last_assessment'] = 'temporal'
+            store_results(f"outputs/results/{output_name}.csv", results, 'temporal')
 
             st.success("✅ Temporal assessment complete!")
 
@@ -1022,11 +1348,11 @@ def run_treatment_comparison(treatment_files, pathogen, raw_conc, dilution, expo
                 frequency_per_year=frequency,
                 population=population,
                 iterations=iterations,
-                output_file=f"{output_name}.csv"
+                output_file=f"{output_name}.csv",
+                n_workers=BATCH_N_WORKERS
             )
 
-            st.session_state['last_results'] = f"outputs/results/{output_name}.csv"
-            st.session_state['last_assessment'] = 'treatment'
+            store_results(f"outputs/results/{output_name}.csv", results, 'treatment')
 
             st.success("✅ Treatment comparison complete!")
 
@@ -1051,11 +1377,11 @@ def run_multi_pathogen_assessment(conc_file, pathogens, exposure_route, treatmen
                 frequency_per_year=frequency,
                 population=population,
                 iterations=iterations,
-                output_file=f"{output_name}.csv"
+                output_file=f"{output_name}.csv",
+                n_workers=BATCH_N_WORKERS
             )
 
-            st.session_state['last_results'] = f"outputs/results/{output_name}.csv"
-            st.session_state['last_assessment'] = 'multi_pathogen'
+            store_results(f"outputs/results/{output_name}.csv", results, 'multi_pathogen')
 
             st.success("✅ Multi-pathogen assessment complete!")
 
@@ -1068,10 +1394,21 @@ def display_results_and_reports():
     if 'last_results' in st.session_state:
         results_file = st.session_state['last_results']
 
-        if Path(results_file).exists():
+        if file_mtime(results_file) is not None:
             st.markdown("### 📊 Results")
 
-            df = pd.read_csv(results_file)
+            if st.session_state.get('results_df') is None:
+                store_results(results_file, load_results(results_file),
+                              st.session_state.get('last_assessment'))
+            df = st.session_state['results_df']
+
+            # Hash the results once per run; the digest keys the plot cache
+            if st.session_state.get('results_digest_key') != st.session_state['run_id']:
+                st.session_state['results_digest'] = dataframe_digest(df)
+                st.session_state['results_digest_key'] = st.session_state['run_id']
+            df_digest = st.session_state['results_digest']
+            tables = result_tables(df_digest, df)
+            metrics = tables[0]
 
             # Summary metrics
             col1, col2, col3, col4 = st.columns(4)
@@ -1081,22 +1418,20 @@ def display_results_and_reports():
 
             with col2:
                 if 'Compliance_Status' in df.columns:
-                    compliant = len(df[df['Compliance_Status'] == 'COMPLIANT'])
+                    compliant = metrics['compliant']
                     st.metric("Compliant", compliant, f"{compliant/len(df)*100:.1f}%")
                 else:
                     st.metric("Compliant", "N/A")
 
             with col3:
                 if 'Annual_Risk_Median' in df.columns:
-                    avg_risk = df['Annual_Risk_Median'].mean()
-                    st.metric("Avg Risk", f"{avg_risk:.2e}")
+                    st.metric("Avg Risk", f"{metrics['risk_mean']:.2e}")
                 else:
                     st.metric("Avg Risk", "N/A")
 
             with col4:
                 if 'Population_Impact' in df.columns:
-                    total_impact = df['Population_Impact'].sum()
-                    st.metric("Total Impact", f"{int(total_impact):,}")
+                    st.metric("Total Impact", f"{int(metrics['impact_total']):,}")
                 else:
                     st.metric("Total Impact", "N/A")
 
@@ -1110,195 +1445,201 @@ def display_results_and_reports():
             # Create tabs for different plots
             plot_tabs = st.tabs(["Risk Overview", "Compliance Distribution", "Risk Distribution", "Population Impact"])
 
-            plots = {}  # Store plots for download
+            for plot_tab, plot_name in zip(plot_tabs, PLOT_BUILDERS):
+                with plot_tab:
+                    st.image(render_plot_png(plot_name, df_digest, df),
+                             use_container_width=True)
 
-            with plot_tabs[0]:
-                fig1 = create_risk_overview_plot(df)
-                st.pyplot(fig1)
-                plots['risk_overview'] = fig1
+            # Download section with expandable options
+            render_downloads(results_file, df, df_digest, tables)
 
-            with plot_tabs[1]:
-                fig2 = create_compliance_plot(df)
-                st.pyplot(fig2)
-                plots['compliance_distribution'] = fig2
+    else:
+        st.info("👆 Run an assessment to see results here")
 
-            with plot_tabs[2]:
-                fig3 = create_risk_distribution_plot(df)
-                st.pyplot(fig3)
-                plots['risk_distribution'] = fig3
 
-            with plot_tabs[3]:
-                fig4 = create_population_impact_plot(df)
-                st.pyplot(fig4)
-                plots['population_impact'] = fig4
+@fragment
+def render_downloads(results_file, df, df_digest, tables):
+    """Render the download panel; its buttons rerun only this section."""
+    results_stem = Path(results_file).stem
+    _, summary_df, subsets = tables
 
-            # Download section with expandable options
-            st.markdown("---")
-            st.markdown("### 📥 Download Results")
+    st.markdown("---")
+    st.markdown("### 📥 Download Results")
 
-            # Main download buttons row
-            col1, col2, col3 = st.columns(3)
+    # Main download buttons row
+    col1, col2, col3 = st.columns(3)
+
+    with col1:
+        # CSV download
+        st.download_button(
+            label="📄 Download Full CSV",
+            data=csv_download_bytes(df_digest, 'results_full', df),
+            file_name=f"{results_stem}.csv",
+            mime="text/csv",
+            use_container_width=True
+        )
+
+    with col2:
+        # PDF report
+        if st.button("📑 Generate PDF Report", use_container_width=True):
+            generate_pdf_report(results_file, df)
+
+    with col3:
+        # Download all bundle - built on request rather than on every
+        # rerun, since it renders every plot at print resolution
+        run_id = st.session_state['run_id']
+        if st.session_state.get('zip_run_id') != run_id:
+            if st.button("📦 Prepare ZIP Package", use_container_width=True):
+                with st.spinner("Building ZIP package..."):
+                    st.session_state['zip_bytes'] = zip_bundle_bytes(
+                        df_digest, results_file, df, tables)
+                st.session_state['zip_run_id'] = run_id
+
+        if st.session_state.get('zip_run_id') == run_id:
+            st.download_button(
+                label="📦 Download All (ZIP)",
+                data=st.session_state['zip_bytes'],
+                file_name=f"{results_stem}_complete_package.zip",
+                mime="application/zip",
+                use_container_width=True
+            )
+
+    # Expandable sections for individual downloads
+    with st.expander("📊 Download Individual Plots"):
+        st.markdown("**Download plots as high-resolution PNG files:**")
+
+        # Expander children run on every rerun, so only rasterize at
+        # print DPI once the user asks for the individual files
+        if st.checkbox("Prepare high-resolution plots", key='show_dl_plots'):
+            plots = render_print_plots(df_digest, df)
+
+            plot_col1, plot_col2 = st.columns(2)
+
+            with plot_col1:
+                st.download_button(
+                    "🔹 Risk Overview Plot",
+                    data=plots['risk_overview'],
+                    file_name="risk_overview.png",
+                    mime="image/png",
+                    use_container_width=True
+                )
 
-            with col1:
-                # CSV download
-                csv = df.to_csv(index=False)
                 st.download_button(
-                    label="📄 Download Full CSV",
-                    data=csv,
-                    file_name=f"{Path(results_file).stem}.csv",
+                    "🔹 Compliance Distribution",
+                    data=plots['compliance_distribution'],
+                    file_name="compliance_distribution.png",
+                    mime="image/png",
+                    use_container_width=True
+                )
+
+            with plot_col2:
+                st.download_button(
+                    "🔹 Risk Distribution",
+                    data=plots['risk_distribution'],
+                    file_name="risk_distribution.png",
+                    mime="image/png",
+                    use_container_width=True
+                )
+
+                st.download_button(
+                    "🔹 Population Impact",
+                    data=plots['population_impact'],
+                    file_name="population_impact.png",
+                    mime="image/png",
+                    use_container_width=True
+                )
+
+    with st.expander("📋 Download Individual Tables"):
+        st.markdown("**Download data subsets as CSV or Excel:**")
+
+        table_col1, table_col2 = st.columns(2)
+
+        with table_col1:
+            # High risk scenarios only (if Risk_Classification exists)
+            if 'high_risk_scenarios' in subsets:
+                st.download_button(
+                    "🔸 High-Risk Scenarios CSV",
+                    data=csv_download_bytes(df_digest, 'high_risk_scenarios', subsets['high_risk_scenarios']),
+                    file_name="high_risk_scenarios.csv",
                     mime="text/csv",
                     use_container_width=True
                 )
 
-            with col2:
-                # PDF report
-                if st.button("📑 Generate PDF Report", use_container_width=True):
-                    generate_pdf_report(results_file, df, plots)
+            # Compliant scenarios only
+            if 'compliant_scenarios' in subsets:
+                st.download_button(
+                    "🔸 Compliant Scenarios CSV",
+                    data=csv_download_bytes(df_digest, 'compliant_scenarios', subsets['compliant_scenarios']),
+                    file_name="compliant_scenarios.csv",
+                    mime="text/csv",
+                    use_container_width=True
+                )
 
-            with col3:
-                # Download all bundle
+            # Summary statistics
+            st.download_button(
+                "🔸 Summary Statistics CSV",
+                data=csv_download_bytes(df_digest, 'summary_statistics', summary_df, index=True),
+                file_name="summary_statistics.csv",
+                mime="text/csv",
+                use_container_width=True
+            )
+
+        with table_col2:
+            # Non-compliant scenarios
+            if 'non_compliant_scenarios' in subsets:
                 st.download_button(
-                    label="📦 Download All (ZIP)",
-                    data=create_zip_bundle(df, plots, results_file),
-                    file_name=f"{Path(results_file).stem}_complete_package.zip",
-                    mime="application/zip",
+                    "🔸 Non-Compliant Scenarios CSV",
+                    data=csv_download_bytes(df_digest, 'non_compliant_scenarios', subsets['non_compliant_scenarios']),
+                    file_name="non_compliant_scenarios.csv",
+                    mime="text/csv",
                     use_container_width=True
                 )
 
-            # Expandable sections for individual downloads
-            with st.expander("📊 Download Individual Plots"):
-                st.markdown("**Download plots as high-resolution PNG files:**")
-
-                plot_col1, plot_col2 = st.columns(2)
-
-                with plot_col1:
-                    st.download_button(
-                        "🔹 Risk Overview Plot",
-                        data=fig_to_bytes(plots['risk_overview']),
-                        file_name="risk_overview.png",
-                        mime="image/png",
-                        use_container_width=True
-                    )
-
-                    st.download_button(
-                        "🔹 Compliance Distribution",
-                        data=fig_to_bytes(plots['compliance_distribution']),
-                        file_name="compliance_distribution.png",
-                        mime="image/png",
-                        use_container_width=True
-                    )
-
-                with plot_col2:
-                    st.download_button(
-                        "🔹 Risk Distribution",
-                        data=fig_to_bytes(plots['risk_distribution']),
-                        file_name="risk_distribution.png",
-                        mime="image/png",
-                        use_container_width=True
-                    )
-
-                    st.download_button(
-                        "🔹 Population Impact",
-                        data=fig_to_bytes(plots['population_impact']),
-                        file_name="population_impact.png",
-                        mime="image/png",
-                        use_container_width=True
-                    )
-
-            with st.expander("📋 Download Individual Tables"):
-                st.markdown("**Download data subsets as CSV or Excel:**")
-
-                table_col1, table_col2 = st.columns(2)
-
-                with table_col1:
-                    # High risk scenarios only (if Risk_Classification exists)
-                    if 'Risk_Classification' in df.columns:
-                        high_risk_df = df[df['Risk_Classification'].isin(['High', 'Medium'])]
-                        if len(high_risk_df) > 0:
-                            st.download_button(
-                                "🔸 High-Risk Scenarios CSV",
-                                data=high_risk_df.to_csv(index=False),
-                                file_name="high_risk_scenarios.csv",
-                                mime="text/csv",
-                                use_container_width=True
-                            )
-
-                    # Compliant scenarios only
-                    if 'Compliance_Status' in df.columns:
-                        compliant_df = df[df['Compliance_Status'] == 'COMPLIANT']
-                        if len(compliant_df) > 0:
-                            st.download_button(
-                                "🔸 Compliant Scenarios CSV",
-                                data=compliant_df.to_csv(index=False),
-                                file_name="compliant_scenarios.csv",
-                                mime="text/csv",
-                                use_container_width=True
-                            )
-
-                    # Summary statistics
-                    summary_df = create_summary_statistics(df)
-                    st.download_button(
-                        "🔸 Summary Statistics CSV",
-                        data=summary_df.to_csv(index=True),
-                        file_name="summary_statistics.csv",
-                        mime="text/csv",
-                        use_container_width=True
-                    )
-
-                with table_col2:
-                    # Non-compliant scenarios
-                    if 'Compliance_Status' in df.columns:
-                        non_compliant_df = df[df['Compliance_Status'] == 'NON-COMPLIANT']
-                        if len(non_compliant_df) > 0:
-                            st.download_button(
-                                "🔸 Non-Compliant Scenarios CSV",
-                                data=non_compliant_df.to_csv(index=False),
-                                file_name="non_compliant_scenarios.csv",
-                                mime="text/csv",
-                                use_container_width=True
-                            )
-
-                    # Top 10 highest risk
-                    if 'Annual_Risk_Median' in df.columns:
-                        top_risk_df = df.nlargest(10, 'Annual_Risk_Median')
-                        st.download_button(
-                            "🔸 Top 10 Highest Risk CSV",
-                            data=top_risk_df.to_csv(index=False),
-                            file_name="top_10_highest_risk.csv",
-                            mime="text/csv",
-                            use_container_width=True
-                        )
-
-                    # Excel format (full results)
-                    excel_buffer = io.BytesIO()
-                    with pd.ExcelWriter(excel_buffer, engine='openpyxl') as writer:
-                        df.to_excel(writer, sheet_name='All Results', index=False)
-                        summary_df.to_excel(writer, sheet_name='Summary Statistics')
-                        if 'Risk_Classification' in df.columns:
-                            high_risk_df = df[df['Risk_Classification'].isin(['High', 'Medium'])]
-                            if len(high_risk_df) > 0:
-                                high_risk_df.to_excel(writer, sheet_name='High Risk', index=False)
-
-                    st.download_button(
-                        "🔸 Full Results Excel",
-                        data=excel_buffer.getvalue(),
-                        file_name="qmra_results_full.xlsx",
-                        mime="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
-                        use_container_width=True
-                    )
+            # Top 10 highest risk
+            if 'top_10_highest_risk' in subsets:
+                st.download_button(
+                    "🔸 Top 10 Highest Risk CSV",
+                    data=csv_download_bytes(df_digest, 'top_10_highest_risk', subsets['top_10_highest_risk']),
+                    file_name="top_10_highest_risk.csv",
+                    mime="text/csv",
+                    use_container_width=True
+                )
 
-    else:
-        st.info("👆 Run an assessment to see results here")
+            # Excel format (full results) - workbook serialization is
+            # slow, so it is only built once the user asks for it
+            if st.session_state.get('excel_run_id') != run_id:
+                if st.button("🔸 Prepare Excel Workbook", use_container_width=True):
+                    with st.spinner("Building Excel workbook..."):
+                        st.session_state['excel_bytes'] = excel_workbook_bytes(df_digest, df, tables)
+                    st.session_state['excel_run_id'] = run_id
 
+            if st.session_state.get('excel_run_id') == run_id:
+                st.download_button(
+                    "🔸 Full Results Excel",
+                    data=st.session_state['excel_bytes'],
+                    file_name="qmra_results_full.xlsx",
+                    mime="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
+                    use_container_width=True
+                )
 
-def generate_pdf_report(csv_file, df, plots=None):
+
+def generate_pdf_report(csv_file, df):
     """Generate and download PDF report."""
     with st.spinner("📑 Generating comprehensive PDF report..."):
         try:
             pdf_file = csv_file.replace('.csv', '_report.pdf')
 
+            # The PDF embeds vector figures, so build them only when requested
+            from pdf_report_generator import QMRAPDFReportGenerator
+
+            plots = {name: build(df) for name, build in PLOT_BUILDERS.items()}
             generator = QMRAPDFReportGenerator()
-            generator.generate_report(df, pdf_file, "QMRA Batch Assessment Report", plots=plots)
+            try:
+                generator.generate_report(df, pdf_file, "QMRA Batch Assessment Report", plots=plots)
+            finally:
+                plt = _get_plt()
+                for fig in plots.values():
+                    plt.close(fig)
 
             # Read PDF and provide download
             with open(pdf_file, 'rb') as f:
@@ -1321,14 +1662,32 @@ def generate_pdf_report(csv_file, df, plots=None):
 
 
 def save_uploaded_file(uploaded_file):
-    """Save uploaded file to temp directory."""
+    """
+    Save uploaded file to temp directory.
+
+    Each upload is written once: reruns return the saved path without
+    rewriting it, which would also bump its mtime and invalidate the
+    cached CSV reads. temp_uploads is shared by all sessions, so the write
+    is only skipped while the file still has the size and mtime this
+    session left it with; if another session saved a file of the same
+    name in between, this session's bytes are written again.
+    """
     if uploaded_file:
         temp_dir = Path("temp_uploads")
-        temp_dir.mkdir(exist_ok=True)
-
         file_path = temp_dir / uploaded_file.name
+
+        saved_uploads = st.session_state.setdefault('saved_uploads', {})
+        file_id = getattr(uploaded_file, 'file_id', None)
+        if file_id is not None and file_path.exists():
+            stat = file_path.stat()
+            if saved_uploads.get(str(file_path)) == (file_id, stat.st_size, stat.st_mtime_ns):
+                return str(file_path)
+
+        temp_dir.mkdir(exist_ok=True)
         with open(file_path, 'wb') as f:
             f.write(uploaded_file.getvalue())
+        stat = file_path.stat()
+        saved_uploads[str(file_path)] = (file_id, stat.st_size, stat.st_mtime_ns)
 
         return str(file_path)
     return None
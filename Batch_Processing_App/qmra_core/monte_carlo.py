@@ -101,16 +101,31 @@ class MonteCarloSimulator:
     This class replaces @Risk functionality with native Python implementation.
     """
 
-    def __init__(self, random_seed: Optional[int] = None):
+    def __init__(self, random_seed: Optional[int] = None, use_numba: bool = False,
+                 rng: Optional[np.random.Generator] = None):
         """
         Initialize Monte Carlo simulator.
 
         Args:
             random_seed: Random seed for reproducible results
+            use_numba: Route Hockey Stick sampling through the compiled kernel
+                in fast_sampling (ignored, with a warning, without Numba)
+            rng: Dedicated random Generator (e.g. from spawn_generators) for
+                parallel runs. If None, samples are drawn from the global
+                np.random state seeded with random_seed, as before.
         """
         self.random_seed = random_seed
-        if random_seed is not None:
-            np.random.seed(random_seed)
+        if use_numba:
+            from .fast_sampling import resolve_use_numba
+            use_numba = resolve_use_numba(use_numba)
+        self.use_numba = use_numba
+        if rng is not None:
+            self.rng = rng
+        else:
+            # The np.random module exposes the same sampling methods as a Generator
+            self.rng = np.random
+            if random_seed is not None:
+                np.random.seed(random_seed)
 
         self.distributions: Dict[str, DistributionParameters] = {}
         self.samples_cache: Dict[str, np.ndarray] = {}
@@ -156,35 +171,35 @@ class MonteCarloSimulator:
         params = dist_params.parameters
 
         if dist_type == DistributionType.NORMAL:
-            return np.random.normal(params["mean"], params["std"], n_samples)
+            return self.rng.normal(params["mean"], params["std"], n_samples)
 
         elif dist_type == DistributionType.LOGNORMAL:
-            return np.random.lognormal(params["mean"], params["std"], n_samples)
+            return self.rng.lognormal(params["mean"], params["std"], n_samples)
 
         elif dist_type == DistributionType.UNIFORM:
-            return np.random.uniform(params["min"], params["max"], n_samples)
+            return self.rng.uniform(params["min"], params["max"], n_samples)
 
         elif dist_type == DistributionType.TRIANGULAR:
-            return np.random.triangular(params["min"], params["mode"], params["max"], n_samples)
+            return self.rng.triangular(params["min"], params["mode"], params["max"], n_samples)
 
         elif dist_type == DistributionType.BETA:
-            return np.random.beta(params["alpha"], params["beta"], n_samples)
+            return self.rng.beta(params["alpha"], params["beta"], n_samples)
 
         elif dist_type == DistributionType.GAMMA:
-            return np.random.gamma(params["shape"], params["scale"], n_samples)
+            return self.rng.gamma(params["shape"], params["scale"], n_samples)
 
         elif dist_type == DistributionType.EXPONENTIAL:
-            return np.random.exponential(params["scale"], n_samples)
+            return self.rng.exponential(params["scale"], n_samples)
 
         elif dist_type == DistributionType.WEIBULL:
             # Note: numpy uses different parameterization than some sources
-            return params["scale"] * np.random.weibull(params["shape"], n_samples)
+            return params["scale"] * self.rng.weibull(params["shape"], n_samples)
 
         elif dist_type == DistributionType.POISSON:
-            return np.random.poisson(params["mu"], n_samples)
+            return self.rng.poisson(params["mu"], n_samples)
 
         elif dist_type == DistributionType.BINOMIAL:
-            return np.random.binomial(params["n"], params["p"], n_samples)
+            return self.rng.binomial(params["n"], params["p"], n_samples)
 
         elif dist_type == DistributionType.EMPIRICAL_CDF:
             # Sample from empirical cumulative distribution function
@@ -198,7 +213,7 @@ class MonteCarloSimulator:
             p_sorted = probabilities[sorted_idx]
 
             # Generate uniform random samples and interpolate
-            uniform_samples = np.random.uniform(0, 1, n_samples)
+            uniform_samples = self.rng.uniform(0, 1, n_samples)
             samples = np.interp(uniform_samples, p_sorted, x_sorted)
 
             # Apply optional bounds
@@ -250,58 +265,41 @@ class MonteCarloSimulator:
             c2 = h1  # Intercept for section 2
             c3 = h2  # Intercept for section 3
 
-            # Generate samples using inverse CDF method
-            samples = np.zeros(n_samples)
-            for i in range(n_samples):
-                u = np.random.uniform(0, 1)
-
-                if u <= 0.5:
-                    # Section 1 (X₀ to X₅₀): Area = 0.5
-                    # CDF: (m1 * (x - X₀)²) / 2 = u
-                    # x = X₀ + sqrt(2*u / m1)
-                    x_sample = x_min + np.sqrt(2.0 * u / m1) if m1 > 0 else x_min
-                    samples[i] = x_sample
-
-                elif u <= P:
-                    # Section 2 (X₅₀ to X_P): Area = P - 0.5
-                    # CDF: 0.5 + ((2*h1 + m2*(x - X₅₀)) / 2) * (x - X₅₀) = u
-                    # This is quadratic: m2/2 * (x - X₅₀)² + h1 * (x - X₅₀) + 0.5 - u = 0
-                    u_scaled = u - 0.5
-                    if m2 != 0:
-                        # Quadratic formula: ax² + bx + c = 0
-                        a = m2 / 2.0
-                        b = h1
-                        c = -u_scaled
-                        discriminant_quad = b**2 - 4*a*c
-                        if discriminant_quad >= 0:
-                            x_delta = (-b + np.sqrt(discriminant_quad)) / (2*a)
-                            samples[i] = x_median + x_delta
-                        else:
-                            samples[i] = x_median  # Fallback
-                    else:
-                        # Linear case (shouldn't happen with hockey stick)
-                        samples[i] = x_median + u_scaled / h1 if h1 > 0 else x_median
-
-                else:
-                    # Section 3 (X_P to X₁₀₀): Area = 1 - P
-                    # CDF: P + ((2*h2 + m3*(x - X_P)) / 2) * (x - X_P) = u
-                    # This is quadratic: m3/2 * (x - X_P)² + h2 * (x - X_P) + P - u = 0
-                    u_scaled = u - P
-                    if m3 != 0:
-                        a = m3 / 2.0
-                        b = h2
-                        c = -u_scaled
-                        discriminant_quad = b**2 - 4*a*c
-                        if discriminant_quad >= 0:
-                            x_delta = (-b + np.sqrt(discriminant_quad)) / (2*a)
-                            samples[i] = x_p + x_delta
-                        else:
-                            samples[i] = x_p  # Fallback
-                    else:
-                        samples[i] = x_p + u_scaled / h2 if h2 > 0 else x_p
-
-                # Ensure sample is within bounds
-                samples[i] = np.clip(samples[i], x_min, x_max)
+            if self.use_numba:
+                from .fast_sampling import hockey_stick_from_uniform
+
+                # Same uniform stream as the NumPy path below, transformed in one kernel call
+                uniform_samples = self.rng.uniform(0, 1, n_samples)
+                return hockey_stick_from_uniform(uniform_samples, x_min, x_median, x_p, x_max,
+                                                 P, h1, h2, m1, m2, m3)
+
+            # Generate samples using inverse CDF method, one section at a time
+            uniform_samples = self.rng.uniform(0, 1, n_samples)
+            samples = np.empty(n_samples)
+
+            in_left = uniform_samples <= 0.5
+            in_middle = ~in_left & (uniform_samples <= P)
+            in_right = ~(in_left | in_middle)
+
+            # Section 1 (X₀ to X₅₀): Area = 0.5
+            # CDF: (m1 * (x - X₀)²) / 2 = u  ->  x = X₀ + sqrt(2*u / m1)
+            if m1 > 0:
+                samples[in_left] = x_min + np.sqrt(2.0 * uniform_samples[in_left] / m1)
+            else:
+                samples[in_left] = x_min
+
+            # Section 2 (X₅₀ to X_P): Area = P - 0.5
+            # Quadratic: m2/2 * (x - X₅₀)² + h1 * (x - X₅₀) + 0.5 - u = 0
+            samples[in_middle] = self._hockey_stick_section(
+                uniform_samples[in_middle] - 0.5, x_median, h1, m2)
+
+            # Section 3 (X_P to X₁₀₀): Area = 1 - P
+            # Quadratic: m3/2 * (x - X_P)² + h2 * (x - X_P) + P - u = 0
+            samples[in_right] = self._hockey_stick_section(
+                uniform_samples[in_right] - P, x_p, h2, m3)
+
+            # Ensure samples are within bounds
+            np.clip(samples, x_min, x_max, out=samples)
 
             return samples
 
@@ -347,7 +345,7 @@ class MonteCarloSimulator:
             cdf_max = loglogistic_cdf(x_max, alpha, beta, gamma)
 
             # Generate uniform samples and transform to truncated distribution
-            uniform_samples = np.random.uniform(0, 1, n_samples)
+            uniform_samples = self.rng.uniform(0, 1, n_samples)
             # Map to truncated range
             u_truncated = cdf_min + uniform_samples * (cdf_max - cdf_min)
             samples = loglogistic_icdf(u_truncated, alpha, beta, gamma)
@@ -360,6 +358,28 @@ class MonteCarloSimulator:
         else:
             raise ValueError(f"Unsupported distribution type: {dist_type}")
 
+    @staticmethod
+    def _hockey_stick_section(u_scaled: np.ndarray, x_start: float,
+                              height: float, slope: float) -> np.ndarray:
+        """
+        Invert one linear section of the Hockey Stick CDF.
+
+        Solves slope/2 * d² + height * d - u_scaled = 0 for the offset d from
+        ``x_start``; falls back to ``x_start`` where there is no real root.
+        """
+        if slope == 0:
+            # Linear case (shouldn't happen with hockey stick)
+            return x_start + u_scaled / height if height > 0 else np.full_like(u_scaled, x_start)
+
+        # Quadratic formula: ax² + bx + c = 0
+        a = slope / 2.0
+        b = height
+        c = -u_scaled
+        discriminant_quad = b**2 - 4*a*c
+        has_root = discriminant_quad >= 0
+        x_delta = (-b + np.sqrt(np.where(has_root, discriminant_quad, 0.0))) / (2*a)
+        return np.where(has_root, x_start + x_delta, x_start)
+
     def run_simulation(self,
                       model_function: Callable,
                       n_iterations: int = 10000,
@@ -466,11 +486,9 @@ class MonteCarloSimulator:
         if len(clean_samples) == 0:
             return {}
 
-        result = {}
-        for p in percentiles:
-            result[f"{p}%"] = float(np.percentile(clean_samples, p))
-
-        return result
+        # One partition pass for all requested percentiles
+        values = np.percentile(clean_samples, percentiles)
+        return {f"{p}%": float(v) for p, v in zip(percentiles, values)}
 
     def sensitivity_analysis(self,
                            base_model_function: Callable,
@@ -686,6 +704,24 @@ def create_hockey_stick_distribution(x_min: float, x_median: float, x_max: float
     )
 
 
+def spawn_generators(seed: Optional[int], n_streams: int) -> List[np.random.Generator]:
+    """
+    Create statistically independent random generators for parallel simulations.
+
+    Streams are spawned from one SeedSequence, so each worker gets its own
+    PCG64DXSM generator with no shared global state between them.
+
+    Args:
+        seed: Root seed (None for fresh OS entropy)
+        n_streams: Number of generators to create
+
+    Returns:
+        List of n_streams Generators, reproducible for a given seed
+    """
+    children = np.random.SeedSequence(seed).spawn(n_streams)
+    return [np.random.Generator(np.random.PCG64DXSM(child)) for child in children]
+
+
 def calculate_empirical_cdf(data: Union[List[float], np.ndarray]) -> Tuple[np.ndarray, np.ndarray]:
     """
     Calculate empirical cumulative distribution function from data.
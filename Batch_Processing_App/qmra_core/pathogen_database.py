@@ -8,6 +8,7 @@ risk assessment.
 
 import json
 import os
+from functools import lru_cache
 from typing import Dict, List, Optional
 from pathlib import Path
 
@@ -283,6 +284,20 @@ class PathogenDatabase:
 
 
 # Convenience function for common use case
+@lru_cache(maxsize=None)
+def get_pathogen_database() -> PathogenDatabase:
+    """
+    Get the shared database for the default pathogen parameters file.
+
+    The JSON file is parsed once per process and the instance is reused by
+    every caller, so treat it as read-only.
+
+    Returns:
+        PathogenDatabase loaded from qmra_core/data/pathogen_parameters.json
+    """
+    return PathogenDatabase()
+
+
 def get_norovirus_parameters() -> Dict:
     """
     Get norovirus dose-response parameters using CORRECT Beta-Binomial model.
@@ -16,162 +16,218 @@ Usage:
     3. Screenshots saved to: screenshots/ directory
 """
 
-import time
-import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from datetime import datetime
 
 try:
-    from selenium import webdriver
     from selenium.webdriver.common.by import By
     from selenium.webdriver.support.ui import WebDriverWait
     from selenium.webdriver.support import expected_conditions as EC
-    from webdriver_manager.chrome import ChromeDriverManager
-    from selenium.webdriver.chrome.service import Service
+    from selenium.common.exceptions import (
+        InvalidSessionIdException,
+        NoSuchElementException,
+        StaleElementReferenceException,
+        TimeoutException,
+        WebDriverException
+    )
+    from screenshot_driver import Page, capture_png, create_driver, open_app_url, save_png, wait_for_app
 except ImportError:
     print("ERROR: Required packages not found!")
     print("Install with: pip install selenium webdriver-manager")
     exit(1)
 
 
+# Transient lookup failures while Streamlit re-renders; keep polling on these
+WAIT_IGNORED_EXCEPTIONS = (NoSuchElementException, StaleElementReferenceException)
+
+# Elements that show a page has rendered
+LOCATORS = {
+    'sidebar': (By.CSS_SELECTOR, '[data-testid="stSidebar"]'),
+    'tabs': (By.CSS_SELECTOR, '[data-testid="stTabs"]'),
+    'select': (By.CSS_SELECTOR, 'select'),
+    'multiselect': (By.CSS_SELECTOR, '[data-testid="stMultiSelect"]')
+}
+
+# Pages in capture order; screenshots are numbered by position
+PAGES = [
+    Page('home_page', '/',
+         'Main application interface with sidebar navigation', LOCATORS['sidebar']),
+    Page('batch_scenarios', '/?page=Batch%20Scenarios',
+         'Batch processing with 15 pre-configured scenarios', LOCATORS['tabs']),
+    Page('spatial_assessment', '/?page=Spatial%20Assessment',
+         'Multi-site risk assessment with dilution factors', LOCATORS['select']),
+    Page('temporal_assessment', '/?page=Temporal%20Assessment',
+         'Time-series risk analysis from monitoring data', LOCATORS['select']),
+    Page('treatment_comparison', '/?page=Treatment%20Comparison',
+         'Compare multiple treatment technologies', LOCATORS['select']),
+    Page('multi_pathogen', '/?page=Multi-Pathogen%20Assessment',
+         'Evaluate multiple pathogens simultaneously', LOCATORS['multiselect'])
+]
+
+
 class AppScreenshotCapture:
     """Captures screenshots of Streamlit app pages."""
 
-    def __init__(self, app_url='http://localhost:8501', output_dir='screenshots'):
+    def __init__(self, app_url='http://localhost:8501', output_dir='screenshots', driver=None,
+                 headless=True, workers=6):
         self.app_url = app_url
         self.output_dir = Path(output_dir)
         self.output_dir.mkdir(exist_ok=True)
 
-        # Setup Chrome driver
-        options = webdriver.ChromeOptions()
-        options.add_argument('--start-maximized')
-        options.add_argument('--disable-notifications')
+        # Reuse a caller's Chrome session (see screenshot_driver.DriverSession)
+        # or start our own when capturing
+        self.headless = headless
+        self.workers = workers
+        self._owns_driver = driver is None
+        self._driver = driver
+
+        # Parallel captures give each worker thread its own Chrome session
+        self._local = threading.local()
+        self._lock = threading.Lock()
 
-        service = Service(ChromeDriverManager().install())
-        self.driver = webdriver.Chrome(service=service, options=options)
+        # PNG decoding and disk writes run here while the browser moves on
+        self._io_pool = ThreadPoolExecutor(max_workers=2)
+        self._pending_writes = []
 
         self.screenshots = []
         print(f"[INIT] Screenshot output directory: {self.output_dir.absolute()}")
 
-    def wait_for_element(self, selector, timeout=10):
-        """Wait for element to be present."""
+    @property
+    def driver(self):
+        """Chrome session of the current capture thread."""
+        return getattr(self._local, 'driver', None) or self._driver
+
+    def _capture_in_own_session(self, number, page):
+        """Capture one page on a Chrome session private to this thread."""
+        self._local.driver = create_driver(headless=self.headless)
         try:
-            WebDriverWait(self.driver, timeout).until(
-                EC.presence_of_element_located((By.CSS_SELECTOR, selector))
+            self.capture_page(number, page)
+        finally:
+            self._local.driver.quit()
+            del self._local.driver
+
+    def _reinit_driver(self):
+        """Replace a lost Chrome session so the remaining pages can still be captured."""
+        try:
+            self.driver.quit()
+        except WebDriverException:
+            pass
+
+        driver = create_driver(headless=self.headless)
+        if getattr(self._local, 'driver', None) is not None:
+            self._local.driver = driver
+        else:
+            # A replaced caller-supplied session is ours to quit
+            self._driver = driver
+            self._owns_driver = True
+
+    def _finish_writes(self):
+        """Wait for queued screenshot writes and report any that failed."""
+        self._io_pool.shutdown(wait=True)
+        for filepath, write in self._pending_writes:
+            if write.exception() is not None:
+                print(f"[ERROR] Failed to write {filepath.name}: {write.exception()}")
+
+    def wait_for_streamlit_idle(self, timeout=15):
+        """Wait until the app view is rendered and Streamlit has finished running."""
+        try:
+            WebDriverWait(self.driver, timeout, poll_frequency=0.1).until(EC.all_of(
+                EC.presence_of_element_located((By.CSS_SELECTOR, '[data-testid="stAppViewContainer"]')),
+                EC.invisibility_of_element_located((By.CSS_SELECTOR, '[data-testid="stStatusWidget"]'))
+            ))
+            return True
+        except TimeoutException:
+            return False
+
+    def wait_for_element(self, locator, timeout=10):
+        """Wait for the element at a (By, value) locator to be present."""
+        try:
+            WebDriverWait(self.driver, timeout, poll_frequency=0.1,
+                          ignored_exceptions=WAIT_IGNORED_EXCEPTIONS).until(
+                EC.presence_of_element_located(locator)
             )
-            time.sleep(1)  # Extra wait for rendering
+            self.wait_for_streamlit_idle()
             return True
-        except:
+        except TimeoutException:
             return False
 
-    def scroll_to_bottom(self):
-        """Scroll to bottom of page."""
+    def scroll_to_bottom(self, timeout=5):
+        """Scroll to bottom of page and wait until the scroll has landed."""
         self.driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
-        time.sleep(0.5)
+        try:
+            WebDriverWait(self.driver, timeout, poll_frequency=0.1).until(
+                lambda driver: driver.execute_script(
+                    "return window.scrollY + window.innerHeight >= document.body.scrollHeight - 1;"
+                )
+            )
+        except TimeoutException:
+            print("[WARN] Page did not finish scrolling, capturing anyway")
 
-    def capture_screenshot(self, page_name, description=''):
+        # Content revealed by the scroll may trigger another Streamlit run
+        self.wait_for_streamlit_idle()
+
+    def capture_screenshot(self, page_name, description='', number=None):
         """Capture and save screenshot."""
         try:
             timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
-            filename = f"{len(self.screenshots)+1:02d}_{page_name}_{timestamp}.png"
+            if number is None:
+                number = len(self.screenshots) + 1
+            filename = f"{number:02d}_{page_name}_{timestamp}.png"
             filepath = self.output_dir / filename
 
-            self.driver.save_screenshot(str(filepath))
-            self.screenshots.append({
-                'filename': filename,
-                'page': page_name,
-                'description': description,
-                'timestamp': timestamp
-            })
+            data = capture_png(self.driver)
+            write = self._io_pool.submit(save_png, filepath, data)
+            with self._lock:
+                self._pending_writes.append((filepath, write))
+                self.screenshots.append({
+                    'filename': filename,
+                    'page': page_name,
+                    'description': description,
+                    'timestamp': timestamp
+                })
 
             print(f"[OK] Captured: {page_name} -> {filename}")
             return filepath
-        except Exception as e:
+        except InvalidSessionIdException as e:
+            print(f"[ERROR] Browser session lost while capturing {page_name}: {e}")
+            self._reinit_driver()
+            return None
+        except WebDriverException as e:
             print(f"[ERROR] Failed to capture {page_name}: {e}")
             return None
 
-    def navigate_and_capture(self, path, page_name, description='', wait_selector=None):
+    def navigate_and_capture(self, path, page_name, description='', wait_locator=None, number=None):
         """Navigate to path and capture screenshot."""
         try:
-            self.driver.get(f"{self.app_url}{path}")
+            open_app_url(self.driver, self.app_url, path)
 
-            if wait_selector:
-                if self.wait_for_element(wait_selector):
+            if wait_locator:
+                if self.wait_for_element(wait_locator):
                     print(f"[WAIT] Element loaded for {page_name}")
                 else:
                     print(f"[WARN] Element not found for {page_name}, proceeding anyway")
             else:
-                time.sleep(2)  # Default wait
+                self.wait_for_streamlit_idle()
 
             self.scroll_to_bottom()
-            self.capture_screenshot(page_name, description)
+            self.capture_screenshot(page_name, description, number)
 
-        except Exception as e:
+        except InvalidSessionIdException as e:
+            print(f"[ERROR] Browser session lost while opening {page_name}: {e}")
+            self._reinit_driver()
+        except WebDriverException as e:
             print(f"[ERROR] Navigation failed for {page_name}: {e}")
 
-    def capture_home_page(self):
-        """Capture main landing page."""
-        print("\n[CAPTURE] Home Page")
-        self.navigate_and_capture(
-            '/',
-            'home_page',
-            'Main application interface with sidebar navigation',
-            '[data-testid="stSidebar"]'
-        )
-
-    def capture_batch_scenarios(self):
-        """Capture Batch Scenarios page."""
-        print("\n[CAPTURE] Batch Scenarios Page")
-        self.navigate_and_capture(
-            '/?page=Batch%20Scenarios',
-            'batch_scenarios',
-            'Batch processing with 15 pre-configured scenarios',
-            '[data-testid="stTabs"]'
-        )
-
-    def capture_spatial_assessment(self):
-        """Capture Spatial Assessment page."""
-        print("\n[CAPTURE] Spatial Assessment Page")
-        self.navigate_and_capture(
-            '/?page=Spatial%20Assessment',
-            'spatial_assessment',
-            'Multi-site risk assessment with dilution factors',
-            'select'
-        )
-
-    def capture_temporal_assessment(self):
-        """Capture Temporal Assessment page."""
-        print("\n[CAPTURE] Temporal Assessment Page")
-        self.navigate_and_capture(
-            '/?page=Temporal%20Assessment',
-            'temporal_assessment',
-            'Time-series risk analysis from monitoring data',
-            'select'
-        )
-
-    def capture_treatment_comparison(self):
-        """Capture Treatment Comparison page."""
-        print("\n[CAPTURE] Treatment Comparison Page")
-        self.navigate_and_capture(
-            '/?page=Treatment%20Comparison',
-            'treatment_comparison',
-            'Compare multiple treatment technologies',
-            'select'
-        )
-
-    def capture_multi_pathogen(self):
-        """Capture Multi-Pathogen Assessment page."""
-        print("\n[CAPTURE] Multi-Pathogen Assessment Page")
-        self.navigate_and_capture(
-            '/?page=Multi-Pathogen%20Assessment',
-            'multi_pathogen',
-            'Evaluate multiple pathogens simultaneously',
-            '[data-testid="stMultiSelect"]'
-        )
+    def capture_page(self, number, page):
+        """Capture one entry of PAGES as screenshot number `number`."""
+        print(f"\n[CAPTURE] {page.name.replace('_', ' ').title()}")
+        self.navigate_and_capture(page.path, page.name, page.description, page.wait, number)
 
     def create_index_html(self):
         """Create HTML index of all screenshots."""
-        html_content = """
+        header = """
 <!DOCTYPE html>
 <html>
 <head>
@@ -203,20 +259,22 @@ class AppScreenshotCapture:
     <hr/>
 """
 
+        parts = [header]
         for i, shot in enumerate(self.screenshots, 1):
-            html_content += f"""
+            parts.append(f"""
     <div class="screenshot">
         <h3>{i}. {shot['page'].replace('_', ' ').title()}</h3>
         <p>{shot['description']}</p>
         <img src="{shot['filename']}" alt="{shot['page']}">
         <p class="meta">File: {shot['filename']}</p>
     </div>
-"""
+""")
 
-        html_content += """
+        parts.append("""
 </body>
 </html>
-"""
+""")
+        html_content = "".join(parts)
 
         index_path = self.output_dir / 'index.html'
         with open(index_path, 'w') as f:
@@ -235,9 +293,10 @@ class AppScreenshotCapture:
             'screenshots': self.screenshots
         }
 
+        # json.dump() to a file issues one write per encoded chunk; encode
+        # the manifest in memory and write it once
         manifest_path = self.output_dir / 'manifest.json'
-        with open(manifest_path, 'w') as f:
-            json.dump(manifest, f, indent=2)
+        manifest_path.write_text(json.dumps(manifest, indent=2))
 
         print(f"[OK] Manifest created: {manifest_path}")
 
@@ -251,16 +310,20 @@ class AppScreenshotCapture:
         print("="*80)
 
         try:
-            self.driver.get(self.app_url)
-            time.sleep(3)  # Wait for app to fully load
+            if self._owns_driver and self.workers > 1:
+                # Streamlit serves every browser connection its own session,
+                # so the pages can be captured side by side
+                with ThreadPoolExecutor(max_workers=self.workers) as pool:
+                    list(pool.map(self._capture_in_own_session, range(1, len(PAGES) + 1), PAGES))
+                self.screenshots.sort(key=lambda shot: shot['filename'])
+            else:
+                if self._driver is None:
+                    self._driver = create_driver(headless=self.headless)
+                self.driver.get(self.app_url)
+                self.wait_for_streamlit_idle()
 
-            # Capture all pages
-            self.capture_home_page()
-            self.capture_batch_scenarios()
-            self.capture_spatial_assessment()
-            self.capture_temporal_assessment()
-            self.capture_treatment_comparison()
-            self.capture_multi_pathogen()
+                for number, page in enumerate(PAGES, 1):
+                    self.capture_page(number, page)
 
             # Create index and manifest
             self.create_index_html()
@@ -276,7 +339,12 @@ class AppScreenshotCapture:
         except Exception as e:
             print(f"[ERROR] Capture failed: {e}")
         finally:
-            self.driver.quit()
+            self._finish_writes()
+            if self._driver is not None:
+                if self._owns_driver:
+                    self._driver.quit()
+                else:
+                    self._driver.delete_all_cookies()
 
 
 def main():
@@ -288,9 +356,11 @@ def main():
     print("\nIf app is not running, start it in another terminal:")
     print("  cd app")
     print("  streamlit run web_app.py")
-    print("\nStarting capture in 5 seconds...\n")
+    print("\nWaiting for the app to respond...\n")
 
-    time.sleep(5)
+    if not wait_for_app('http://localhost:8501'):
+        print("[ERROR] No response from http://localhost:8501 - is the app running?")
+        return
 
     # Create capturer and run
     capturer = AppScreenshotCapture(
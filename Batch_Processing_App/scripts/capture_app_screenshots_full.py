@@ -4,7 +4,7 @@ Enhanced Screenshot Capture for QMRA Web App
 =============================================
 
 Captures FULL PAGE screenshots including content below the fold.
-Takes multiple screenshots per page by scrolling.
+Takes one screenshot per page covering its full content height.
 
 Usage:
     1. Start the Streamlit app: streamlit run web_app.py
@@ -12,254 +12,235 @@ Usage:
     3. Screenshots saved to: screenshots_full/ directory
 """
 
-import time
-import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from datetime import datetime
 
 try:
-    from selenium import webdriver
     from selenium.webdriver.common.by import By
     from selenium.webdriver.support.ui import WebDriverWait
     from selenium.webdriver.support import expected_conditions as EC
-    from selenium.webdriver.common.action_chains import ActionChains
-    from selenium.webdriver.common.keys import Keys
-    from webdriver_manager.chrome import ChromeDriverManager
-    from selenium.webdriver.chrome.service import Service
+    from selenium.common.exceptions import (
+        InvalidSessionIdException,
+        NoSuchElementException,
+        StaleElementReferenceException,
+        TimeoutException,
+        WebDriverException
+    )
+    from screenshot_driver import Page, capture_png, create_driver, open_app_url, save_png, wait_for_app
 except ImportError:
     print("ERROR: Required packages not found!")
     print("Install with: pip install selenium webdriver-manager")
     exit(1)
 
 
+# Transient lookup failures while Streamlit re-renders; keep polling on these
+WAIT_IGNORED_EXCEPTIONS = (NoSuchElementException, StaleElementReferenceException)
+
+# Pages in capture order; the number prefix keeps files and the index sorted
+PAGES = [
+    Page('01_home_page',
+         description='Main application interface with sidebar and welcome message'),
+    Page('02_batch_scenarios',
+         description='Batch Scenarios Assessment - Overview and configuration'),
+    Page('03_spatial_assessment',
+         description='Spatial Risk Assessment - Multi-site evaluation'),
+    Page('04_temporal_assessment',
+         description='Temporal Risk Assessment - Time series analysis'),
+    Page('05_treatment_comparison',
+         description='Treatment Comparison - Side-by-side evaluation'),
+    Page('06_multi_pathogen',
+         description='Multi-Pathogen Assessment - Comparative analysis')
+]
+
+
 class EnhancedScreenshotCapture:
-    """Captures comprehensive screenshots with scrolling for full page content."""
+    """Captures comprehensive screenshots covering each page's full content height."""
 
-    def __init__(self, app_url='http://localhost:8501', output_dir='screenshots_full'):
+    def __init__(self, app_url='http://localhost:8501', output_dir='screenshots_full', driver=None,
+                 headless=True, workers=6):
         self.app_url = app_url
         self.output_dir = Path(output_dir)
         self.output_dir.mkdir(exist_ok=True)
 
-        # Setup Chrome driver with larger window
-        options = webdriver.ChromeOptions()
-        options.add_argument('--start-maximized')
-        options.add_argument('--disable-notifications')
-        options.add_argument('--window-size=1920,1080')
+        # Reuse a caller's Chrome session (see screenshot_driver.DriverSession)
+        # or start our own when capturing
+        self.headless = headless
+        self.workers = workers
+        self._owns_driver = driver is None
+        self._driver = driver
 
-        service = Service(ChromeDriverManager().install())
-        self.driver = webdriver.Chrome(service=service, options=options)
+        # Parallel captures give each worker thread its own Chrome session
+        self._local = threading.local()
+        self._lock = threading.Lock()
 
-        # Maximize window
-        self.driver.maximize_window()
-        time.sleep(1)
+        # PNG decoding and disk writes run here while the browser moves on
+        self._io_pool = ThreadPoolExecutor(max_workers=2)
+        self._pending_writes = []
 
         self.screenshots = []
         print(f"[INIT] Screenshot output directory: {self.output_dir.absolute()}")
 
+    @property
+    def driver(self):
+        """Chrome session of the current capture thread."""
+        return getattr(self._local, 'driver', None) or self._driver
+
+    def _capture_in_own_session(self, page):
+        """Capture one page on a Chrome session private to this thread."""
+        self._local.driver = create_driver(headless=self.headless)
+        try:
+            self.capture_page(page)
+        finally:
+            self._local.driver.quit()
+            del self._local.driver
+
+    def _reinit_driver(self):
+        """Replace a lost Chrome session so the remaining pages can still be captured."""
+        try:
+            self.driver.quit()
+        except WebDriverException:
+            pass
+
+        driver = create_driver(headless=self.headless)
+        if getattr(self._local, 'driver', None) is not None:
+            self._local.driver = driver
+        else:
+            # A replaced caller-supplied session is ours to quit
+            self._driver = driver
+            self._owns_driver = True
+
+    def _finish_writes(self):
+        """Wait for queued screenshot writes and report any that failed."""
+        self._io_pool.shutdown(wait=True)
+        for filepath, write in self._pending_writes:
+            if write.exception() is not None:
+                print(f"[ERROR] Failed to write {filepath.name}: {write.exception()}")
+
+    def wait_for_streamlit_idle(self, timeout=15):
+        """Wait until the app view is rendered and Streamlit has finished running."""
+        try:
+            WebDriverWait(self.driver, timeout, poll_frequency=0.1).until(EC.all_of(
+                EC.presence_of_element_located((By.CSS_SELECTOR, '[data-testid="stAppViewContainer"]')),
+                EC.invisibility_of_element_located((By.CSS_SELECTOR, '[data-testid="stStatusWidget"]'))
+            ))
+            return True
+        except TimeoutException:
+            return False
+
     def wait_for_streamlit(self, timeout=15):
         """Wait for Streamlit to finish loading."""
         try:
             # Wait for main content to be present
-            WebDriverWait(self.driver, timeout).until(
+            WebDriverWait(self.driver, timeout, poll_frequency=0.1,
+                          ignored_exceptions=WAIT_IGNORED_EXCEPTIONS).until(
                 EC.presence_of_element_located((By.TAG_NAME, "main"))
             )
-            time.sleep(2)  # Extra wait for dynamic content
+            self.wait_for_streamlit_idle()
             return True
-        except:
+        except TimeoutException:
             print("[WARN] Streamlit content not fully loaded")
             return False
 
-    def get_page_height(self):
-        """Get total scrollable height of the page."""
-        return self.driver.execute_script("return document.body.scrollHeight")
-
-    def scroll_to_position(self, position):
-        """Scroll to specific position."""
-        self.driver.execute_script(f"window.scrollTo(0, {position});")
-        time.sleep(1)  # Wait for content to render
+    def get_page_size(self):
+        """Get the page's full content width and height in one CDP call."""
+        content = self.driver.execute_cdp_cmd('Page.getLayoutMetrics', {})['contentSize']
+        return int(content['width']), int(content['height'])
 
     def capture_screenshot(self, filename, description=''):
         """Capture and save screenshot."""
         try:
             filepath = self.output_dir / filename
-            self.driver.save_screenshot(str(filepath))
+            data = capture_png(self.driver)
+            write = self._io_pool.submit(save_png, filepath, data)
 
-            self.screenshots.append({
-                'filename': filename,
-                'description': description,
-                'timestamp': datetime.now().strftime('%Y%m%d_%H%M%S')
-            })
+            with self._lock:
+                self._pending_writes.append((filepath, write))
+                self.screenshots.append({
+                    'filename': filename,
+                    'description': description,
+                    'timestamp': datetime.now().strftime('%Y%m%d_%H%M%S')
+                })
 
             print(f"[OK] Captured: {filename}")
             return filepath
-        except Exception as e:
+        except InvalidSessionIdException as e:
+            print(f"[ERROR] Browser session lost while capturing {filename}: {e}")
+            self._reinit_driver()
+            return None
+        except WebDriverException as e:
             print(f"[ERROR] Failed to capture {filename}: {e}")
             return None
 
-    def capture_full_page(self, page_name, description='', scroll_positions=None):
+    def capture_full_page(self, page_name, description=''):
         """
-        Capture multiple screenshots of a page at different scroll positions.
+        Capture the whole page, including content below the fold, as one image.
+
+        The viewport is stretched to the page's content size for the capture
+        and restored afterwards, so no scrolling or stitching is needed.
 
         Args:
             page_name: Base name for the page
             description: Description of the page
-            scroll_positions: List of positions like ['top', 'middle', 'bottom']
-                            or None to auto-detect
-        """
-        if scroll_positions is None:
-            scroll_positions = ['top', 'middle', 'bottom']
-
-        # Scroll to top first
-        self.scroll_to_position(0)
-        time.sleep(1)
 
-        page_height = self.get_page_height()
-        window_height = self.driver.execute_script("return window.innerHeight")
+        Returns:
+            List with the saved screenshot path (empty if the capture failed)
+        """
+        page_width, page_height = self.get_page_size()
 
         print(f"\n[INFO] Page: {page_name}")
-        print(f"  Total height: {page_height}px")
-        print(f"  Window height: {window_height}px")
-
-        captured = []
-
-        for position_name in scroll_positions:
-            if position_name == 'top':
-                scroll_pos = 0
-            elif position_name == 'middle':
-                scroll_pos = max(0, (page_height - window_height) // 2)
-            elif position_name == 'bottom':
-                scroll_pos = max(0, page_height - window_height)
-            else:
-                continue
-
-            # Only capture if there's content at this position
-            if page_height <= window_height and position_name != 'top':
-                print(f"  [SKIP] {position_name} - Page fits in one screen")
-                continue
-
-            self.scroll_to_position(scroll_pos)
+        print(f"  Total size: {page_width}x{page_height}px")
+
+        self.driver.execute_cdp_cmd('Emulation.setDeviceMetricsOverride', {
+            'width': page_width,
+            'height': page_height,
+            'deviceScaleFactor': 1,
+            'mobile': False
+        })
+        try:
             timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
-            filename = f"{page_name}_{position_name}_{timestamp}.png"
-
-            desc = f"{description} - {position_name.title()} section"
-            filepath = self.capture_screenshot(filename, desc)
-
-            if filepath:
-                captured.append(filepath)
+            filename = f"{page_name}_{timestamp}.png"
+            filepath = self.capture_screenshot(filename, description)
+        finally:
+            self.driver.execute_cdp_cmd('Emulation.clearDeviceMetricsOverride', {})
 
-        return captured
+        return [filepath] if filepath else []
 
     def navigate_to_page(self, path, page_name):
         """Navigate to a specific page and wait for it to load."""
         try:
             url = f"{self.app_url}{path}"
             print(f"\n[NAV] Navigating to: {url}")
-            self.driver.get(url)
+            open_app_url(self.driver, self.app_url, path)
 
             # Wait for Streamlit to load
             self.wait_for_streamlit()
 
-            # Scroll to top
-            self.scroll_to_position(0)
-
             return True
-        except Exception as e:
+        except InvalidSessionIdException as e:
+            print(f"[ERROR] Browser session lost while opening {page_name}: {e}")
+            self._reinit_driver()
+            return False
+        except WebDriverException as e:
             print(f"[ERROR] Navigation failed for {page_name}: {e}")
             return False
 
-    def capture_home_page(self):
-        """Capture home/welcome page."""
+    def capture_page(self, page):
+        """Capture one entry of PAGES at full height."""
         print("\n" + "="*80)
-        print("[CAPTURE] HOME PAGE")
+        print(f"[CAPTURE] {page.name.split('_', 1)[1].replace('_', ' ').upper()}")
         print("="*80)
 
-        if self.navigate_to_page('/', 'home_page'):
-            self.capture_full_page(
-                '01_home_page',
-                'Main application interface with sidebar and welcome message'
-            )
-
-    def capture_batch_scenarios(self):
-        """Capture Batch Scenarios page with all sections."""
-        print("\n" + "="*80)
-        print("[CAPTURE] BATCH SCENARIOS")
-        print("="*80)
-
-        if self.navigate_to_page('/', 'batch_scenarios'):
-            # Select Batch Scenarios from dropdown
+        if self.navigate_to_page(page.path, page.name):
             try:
-                # Wait a bit for page to load
-                time.sleep(3)
-
-                # Capture initial view
-                self.capture_full_page(
-                    '02_batch_scenarios',
-                    'Batch Scenarios Assessment - Overview and configuration',
-                    ['top', 'middle', 'bottom']
-                )
-
-            except Exception as e:
-                print(f"[ERROR] Failed to interact with Batch Scenarios: {e}")
-
-    def capture_spatial_assessment(self):
-        """Capture Spatial Assessment page."""
-        print("\n" + "="*80)
-        print("[CAPTURE] SPATIAL ASSESSMENT")
-        print("="*80)
-
-        if self.navigate_to_page('/', 'spatial'):
-            time.sleep(3)
-            self.capture_full_page(
-                '03_spatial_assessment',
-                'Spatial Risk Assessment - Multi-site evaluation',
-                ['top', 'middle', 'bottom']
-            )
-
-    def capture_temporal_assessment(self):
-        """Capture Temporal Assessment page."""
-        print("\n" + "="*80)
-        print("[CAPTURE] TEMPORAL ASSESSMENT")
-        print("="*80)
-
-        if self.navigate_to_page('/', 'temporal'):
-            time.sleep(3)
-            self.capture_full_page(
-                '04_temporal_assessment',
-                'Temporal Risk Assessment - Time series analysis',
-                ['top', 'middle', 'bottom']
-            )
-
-    def capture_treatment_comparison(self):
-        """Capture Treatment Comparison page."""
-        print("\n" + "="*80)
-        print("[CAPTURE] TREATMENT COMPARISON")
-        print("="*80)
-
-        if self.navigate_to_page('/', 'treatment'):
-            time.sleep(3)
-            self.capture_full_page(
-                '05_treatment_comparison',
-                'Treatment Comparison - Side-by-side evaluation',
-                ['top', 'middle', 'bottom']
-            )
-
-    def capture_multi_pathogen(self):
-        """Capture Multi-Pathogen Assessment page."""
-        print("\n" + "="*80)
-        print("[CAPTURE] MULTI-PATHOGEN ASSESSMENT")
-        print("="*80)
-
-        if self.navigate_to_page('/', 'multipathogen'):
-            time.sleep(3)
-            self.capture_full_page(
-                '06_multi_pathogen',
-                'Multi-Pathogen Assessment - Comparative analysis',
-                ['top', 'middle', 'bottom']
-            )
+                self.capture_full_page(page.name, page.description)
+            except WebDriverException as e:
+                print(f"[ERROR] Failed to capture {page.name}: {e}")
 
     def create_index_html(self):
         """Create HTML index of all screenshots."""
-        html_content = """
+        header = """
 <!DOCTYPE html>
 <html>
 <head>
@@ -293,20 +274,22 @@ class EnhancedScreenshotCapture:
     <hr/>
 """
 
+        parts = [header]
         for i, shot in enumerate(self.screenshots, 1):
-            html_content += f"""
+            parts.append(f"""
     <div class="screenshot">
         <h3>{i}. {shot['filename']}</h3>
         <p>{shot['description']}</p>
         <img src="{shot['filename']}" alt="{shot['filename']}">
         <p class="meta">File: {shot['filename']} | Captured: {shot['timestamp']}</p>
     </div>
-"""
+""")
 
-        html_content += """
+        parts.append("""
 </body>
 </html>
-"""
+""")
+        html_content = "".join(parts)
 
         index_path = self.output_dir / 'index.html'
         with open(index_path, 'w') as f:
@@ -319,24 +302,27 @@ class EnhancedScreenshotCapture:
         """Capture all pages with full content."""
         print("\n" + "="*80)
         print("QMRA APP ENHANCED SCREENSHOT CAPTURE")
-        print("Capturing FULL PAGE content with scrolling")
+        print("Capturing FULL PAGE content in a single screenshot per page")
         print("="*80)
         print(f"App URL: {self.app_url}")
         print(f"Output: {self.output_dir.absolute()}")
         print("="*80)
 
         try:
-            # Load app first
-            self.driver.get(self.app_url)
-            time.sleep(5)  # Wait for initial load
-
-            # Capture all pages
-            self.capture_home_page()
-            self.capture_batch_scenarios()
-            self.capture_spatial_assessment()
-            self.capture_temporal_assessment()
-            self.capture_treatment_comparison()
-            self.capture_multi_pathogen()
+            if self._owns_driver and self.workers > 1:
+                # Streamlit serves every browser connection its own session,
+                # so the pages can be captured side by side
+                with ThreadPoolExecutor(max_workers=self.workers) as pool:
+                    list(pool.map(self._capture_in_own_session, PAGES))
+                self.screenshots.sort(key=lambda shot: shot['filename'])
+            else:
+                if self._driver is None:
+                    self._driver = create_driver(headless=self.headless)
+                self.driver.get(self.app_url)
+                self.wait_for_streamlit_idle()
+
+                for page in PAGES:
+                    self.capture_page(page)
 
             # Create index
             self.create_index_html()
@@ -352,7 +338,12 @@ class EnhancedScreenshotCapture:
             import traceback
             traceback.print_exc()
         finally:
-            self.driver.quit()
+            self._finish_writes()
+            if self._driver is not None:
+                if self._owns_driver:
+                    self._driver.quit()
+                else:
+                    self._driver.delete_all_cookies()
 
 
 def main():
@@ -363,9 +354,11 @@ def main():
     print("\nIf app is not running, start it in another terminal:")
     print("  cd Batch_Processing_App/app")
     print("  streamlit run web_app.py")
-    print("\nStarting enhanced capture in 5 seconds...\n")
+    print("\nWaiting for the app to respond...\n")
 
-    time.sleep(5)
+    if not wait_for_app('http://localhost:8501'):
+        print("[ERROR] No response from http://localhost:8501 - is the app running?")
+        return
 
     # Create capturer and run
     capturer = EnhancedScreenshotCapture(
@@ -299,12 +299,12 @@ ADVANCED OPTIONS
      )
 
 3. CAPTURE ONLY SPECIFIC PAGES:
-   Edit the run_all() method in capture_app_screenshots.py:
-     def run_all(self):
-         self.capture_home_page()
-         self.capture_batch_scenarios()
+   Edit the PAGES list in capture_app_screenshots.py:
+     PAGES = [
+         Page('home_page', '/', ...),
+         Page('batch_scenarios', '/?page=Batch%20Scenarios', ...),
          # Comment out or remove others
-         self.create_index_html()
+     ]
 
 4. BATCH PROCESSING:
    Create a batch script to capture multiple times:
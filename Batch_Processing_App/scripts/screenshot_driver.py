@@ -0,0 +1,207 @@
+#!/usr/bin/env python3
+"""
+Shared Chrome WebDriver Setup for Screenshot Capture
+====================================================
+
+Used by capture_app_screenshots.py and capture_app_screenshots_full.py so
+both scripts start Chrome the same way and can share one browser session.
+
+Usage (run both captures on a single Chrome instance):
+    from screenshot_driver import DriverSession
+    from capture_app_screenshots import AppScreenshotCapture
+    from capture_app_screenshots_full import EnhancedScreenshotCapture
+
+    with DriverSession() as driver:
+        AppScreenshotCapture(output_dir='../screenshots', driver=driver).run_all()
+        EnhancedScreenshotCapture(output_dir='../screenshots_full', driver=driver).run_all()
+"""
+
+import base64
+import threading
+import time
+import urllib.request
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Optional, Tuple
+
+from selenium import webdriver
+from selenium.common.exceptions import SessionNotCreatedException
+from selenium.webdriver.chrome.service import Service
+from webdriver_manager.chrome import ChromeDriverManager
+
+# Resolved chromedriver binary, so later runs skip webdriver-manager's
+# version check and download
+DRIVER_PATH_CACHE = Path.home() / '.cache' / 'qmra_driver_path'
+
+# Parallel captures start several browsers at once; only one of them should
+# run webdriver-manager
+_driver_path_lock = threading.Lock()
+
+# Injected into every page: switches off CSS animations and transitions so
+# pages settle straight away and the idle waits return sooner
+DISABLE_ANIMATIONS_SCRIPT = (
+    'document.addEventListener("DOMContentLoaded", () => {'
+    'const style = document.createElement("style");'
+    'style.textContent = "*{animation:none!important;transition:none!important}";'
+    'document.head.appendChild(style);'
+    '});'
+)
+
+
+@dataclass(frozen=True)
+class Page:
+    """An app page to capture and the element that shows it has loaded."""
+    name: str
+    path: str = '/'
+    description: str = ''
+    wait: Optional[Tuple[str, str]] = None
+
+
+def chromedriver_path(refresh=False):
+    """
+    Return the chromedriver binary path, reusing the last resolved one.
+
+    Args:
+        refresh: Ignore the cached path and resolve it with webdriver-manager
+    """
+    with _driver_path_lock:
+        if not refresh and DRIVER_PATH_CACHE.exists():
+            cached_path = DRIVER_PATH_CACHE.read_text().strip()
+            if Path(cached_path).exists():
+                return cached_path
+
+        path = ChromeDriverManager().install()
+        DRIVER_PATH_CACHE.parent.mkdir(parents=True, exist_ok=True)
+        DRIVER_PATH_CACHE.write_text(path)
+        return path
+
+
+def get_service(refresh=False):
+    """Chrome service for the cached (or, with refresh, re-resolved) chromedriver."""
+    return Service(chromedriver_path(refresh=refresh))
+
+
+def wait_for_app(app_url, timeout=60):
+    """
+    Poll Streamlit's health endpoint until the server answers.
+
+    Returns as soon as the app is up instead of sleeping for a fixed time
+    before capturing, and lets the caller stop early if it never comes up.
+
+    Args:
+        app_url: Base URL of the running Streamlit app
+        timeout: Seconds to keep polling
+
+    Returns:
+        True if the app responded within timeout, False otherwise
+    """
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        try:
+            with urllib.request.urlopen(f"{app_url}/_stcore/health", timeout=2) as response:
+                if response.status == 200:
+                    return True
+        except OSError:
+            pass
+        time.sleep(0.2)
+    return False
+
+
+def create_driver(headless=True):
+    """
+    Start a 1920x1080 Chrome session for capturing the app.
+
+    Args:
+        headless: Render offscreen without a browser window. Pass False to
+            watch the capture while debugging; a few pages may lay out
+            slightly differently between the two modes.
+    """
+    options = webdriver.ChromeOptions()
+    options.add_argument('--disable-notifications')
+    options.add_argument('--window-size=1920,1080')
+    options.add_argument('--blink-settings=imagesEnabled=true,animationEnabled=false')
+    options.add_argument('--disable-features=TranslateUI,BackForwardCache')
+
+    # Return from driver.get() at DOMContentLoaded; the idle waits cover the
+    # rest of Streamlit's loading
+    options.page_load_strategy = 'eager'
+
+    if headless:
+        options.add_argument('--headless=new')
+        options.add_argument('--disable-gpu')
+        options.add_argument('--no-sandbox')
+        options.add_argument('--disable-dev-shm-usage')
+        options.add_argument('--hide-scrollbars')
+    else:
+        options.add_argument('--start-maximized')
+
+    try:
+        driver = webdriver.Chrome(service=get_service(), options=options)
+    except SessionNotCreatedException:
+        # The cached chromedriver no longer matches Chrome after a browser
+        # update; resolve a matching one and retry once
+        driver = webdriver.Chrome(service=get_service(refresh=True), options=options)
+    if not headless:
+        driver.maximize_window()
+
+    driver.execute_cdp_cmd('Page.addScriptToEvaluateOnNewDocument',
+                           {'source': DISABLE_ANIMATIONS_SCRIPT})
+    return driver
+
+
+def open_app_url(driver, app_url, path=''):
+    """
+    Open app_url + path, routing in place when the browser is already on the app.
+
+    A full driver.get() reloads the document, reconnects Streamlit's
+    websocket and re-fetches its assets. Pushing the new URL onto the
+    history keeps the running session; driver.get() is only used for the
+    first visit or if the in-place change did not take.
+    """
+    url = f"{app_url}{path}"
+    if driver.current_url.startswith(app_url):
+        driver.execute_script(
+            "window.history.pushState(null, '', arguments[0]);"
+            "window.dispatchEvent(new PopStateEvent('popstate'));",
+            url
+        )
+        if driver.current_url == url:
+            return
+    driver.get(url)
+
+
+def capture_png(driver):
+    """
+    Capture the page as a base64-encoded PNG through the Chrome DevTools protocol.
+
+    optimizeForSpeed trades PNG compression for encode time, which
+    save_screenshot() does not expose. Decoding is left to save_png() so it
+    can run off the thread driving the browser.
+    """
+    result = driver.execute_cdp_cmd('Page.captureScreenshot', {
+        'format': 'png',
+        'optimizeForSpeed': True,
+        'captureBeyondViewport': True
+    })
+    return result['data']
+
+
+def save_png(filepath, data):
+    """Decode a base64 PNG from capture_png() and write it to filepath."""
+    Path(filepath).write_bytes(base64.b64decode(data))
+
+
+class DriverSession:
+    """Context manager owning one Chrome session shared by several capturers."""
+
+    def __init__(self, headless=True):
+        self.headless = headless
+        self.driver = None
+
+    def __enter__(self):
+        self.driver = create_driver(headless=self.headless)
+        return self.driver
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.driver.quit()
+        return False
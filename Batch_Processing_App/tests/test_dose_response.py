@@ -0,0 +1,181 @@
+#!/usr/bin/env python3
+"""
+Test the fast paths in the dose-response models.
+
+Shortcuts such as the Beta-Binomial integer-dose table must return exactly
+what the closed-form formula gives, so validated results never move.
+"""
+
+import sys
+import warnings
+from pathlib import Path
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from qmra_core.dose_response import (
+    BETA_BINOMIAL_TABLE_SIZE,
+    BetaBinomialModel,
+    BetaPoissonModel,
+    ExponentialModel,
+    create_dose_response_model
+)
+
+
+def _norovirus_model():
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore", UserWarning)
+        return BetaBinomialModel({"alpha": 0.04, "beta": 0.055})
+
+
+def test_beta_binomial_table_matches_formula():
+    """Integer doses read from the table equal the log-gamma formula."""
+    model = _norovirus_model()
+    doses = np.random.default_rng(0).integers(0, 2 * BETA_BINOMIAL_TABLE_SIZE, 10000)
+
+    np.testing.assert_array_equal(model.calculate_infection_probability(doses),
+                                  model.calculate_infection_probability(doses.astype(float)))
+    assert model.calculate_infection_probability(1) == model.calculate_infection_probability(1.0)
+
+
+def test_beta_binomial_dose_for_risk_inverts_model():
+    """Doses found through the bracketing grid reproduce the target risk."""
+    model = _norovirus_model()
+
+    for target in (1e-6, 1e-4, 0.01, 0.3, 0.5):
+        dose = model.calculate_dose_for_risk(target)
+        assert np.isclose(model.calculate_infection_probability(dose), target, rtol=1e-6)
+
+
+def test_beta_binomial_dose_for_risk_at_grid_ends():
+    """Targets on or beyond either end of the bracketing grid are still solved."""
+    model = _norovirus_model()
+    model.calculate_dose_for_risk(0.1)
+    dose_grid, risk_grid = model._risk_grid
+
+    # On the first and last grid points, and below the first non-zero one
+    for target in (risk_grid[1], risk_grid[1] / 10, risk_grid[-1]):
+        dose = model.calculate_dose_for_risk(target)
+        assert np.isclose(model.calculate_infection_probability(dose), target, rtol=1e-6)
+    assert np.isclose(model.calculate_dose_for_risk(risk_grid[-1]), dose_grid[-1])
+
+    # Above the risk at 10^6 organisms there is no dose in the search range
+    try:
+        model.calculate_dose_for_risk((risk_grid[-1] + 1) / 2)
+    except ValueError:
+        pass
+    else:
+        raise AssertionError("targets beyond the search range should raise ValueError")
+
+
+def test_batch_probabilities_match_per_model():
+    """Broadcast parameter sweeps equal one model evaluation per (alpha, beta)."""
+    doses = np.array([0.0, 1.0, 2.5, 10.0, 1e4])
+    alphas = np.array([0.04, 0.145, 2.0])
+    betas = np.array([0.055, 7.59, 3.0])
+
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore", UserWarning)
+        for model_class in (BetaBinomialModel, BetaPoissonModel):
+            expected = np.array([model_class({"alpha": a, "beta": b}).calculate_infection_probability(doses)
+                                 for a, b in zip(alphas, betas)])
+            np.testing.assert_array_equal(
+                model_class.calculate_infection_probability_batch(doses, alphas, betas), expected)
+
+
+def test_scalar_doses_match_array_path():
+    """Plain float and int doses return floats equal to the array evaluation."""
+    models = [_norovirus_model(), BetaPoissonModel({"alpha": 0.145, "beta": 7.59}),
+              ExponentialModel({"r": 0.0042})]
+
+    for model in models:
+        for dose in (0, 3, 2.5, 1e4, 1e7):
+            prob = model.calculate_infection_probability(dose)
+            assert isinstance(prob, float)
+            np.testing.assert_allclose(prob, model.calculate_infection_probability(np.array(dose, dtype=float)),
+                                       rtol=1e-15)
+
+
+def test_low_dose_risk_keeps_precision():
+    """Tiny doses keep full precision instead of cancelling in 1 - x."""
+    beta_poisson = BetaPoissonModel({"alpha": 0.145, "beta": 7.59})
+    exponential = ExponentialModel({"r": 0.0042})
+
+    assert np.isclose(beta_poisson.calculate_infection_probability(1e-12), 0.145 / 7.59 * 1e-12, rtol=1e-9)
+    assert np.isclose(exponential.calculate_infection_probability(1e-12), 0.0042e-12, rtol=1e-9)
+    assert np.isclose(beta_poisson.calculate_infection_probability(
+        beta_poisson.calculate_dose_for_risk(1e-6)), 1e-6, rtol=1e-12)
+
+
+def test_beta_poisson_float32_path():
+    """Single-precision evaluation stays in float32 and keeps ~7 significant digits."""
+    model = BetaPoissonModel({"alpha": np.float64(0.145), "beta": 7.59})
+    doses = np.logspace(-6, 6, 1000)
+
+    prob32 = model.calculate_infection_probability(doses, dtype=np.float32)
+
+    assert prob32.dtype == np.float32
+    np.testing.assert_allclose(prob32, model.calculate_infection_probability(doses), rtol=1e-6)
+
+
+def test_out_buffer_matches_fresh_result():
+    """Writing into a caller-supplied array gives the same values and returns it."""
+    models = [_norovirus_model(), BetaPoissonModel({"alpha": 0.145, "beta": 7.59}),
+              ExponentialModel({"r": 0.0042})]
+    doses = np.concatenate([np.arange(50.0), np.logspace(-6, 7, 200)])
+
+    for model in models:
+        for dose in (doses, doses.astype(int)):
+            out = np.empty(dose.shape)
+            assert model.calculate_infection_probability(dose, out=out) is out
+            np.testing.assert_array_equal(out, model.calculate_infection_probability(dose))
+
+
+def test_factory_shares_models_per_parameter_set():
+    """Equal parameters reuse one model that does not alias the caller's dict."""
+    parameters = {"alpha": 0.145, "beta": 7.59}
+    model = create_dose_response_model("beta_poisson", parameters)
+
+    assert create_dose_response_model("Beta_Poisson", {"beta": 7.59, "alpha": 0.145}) is model
+    parameters["alpha"] = 0.5
+    assert model.parameters["alpha"] == 0.145
+    assert create_dose_response_model("beta_poisson", parameters) is not model
+
+
+def test_factory_models_cannot_affect_each_other():
+    """A shared model's parameters are read-only and its warnings repeat per call."""
+    first = create_dose_response_model("beta_binomial", {"alpha": 0.04, "beta": 0.055})
+    second = create_dose_response_model("beta_binomial", {"alpha": 0.04, "beta": 0.055})
+    assert second is first
+
+    try:
+        first.parameters["alpha"] = 0.5
+    except TypeError:
+        pass
+    else:
+        raise AssertionError("shared model parameters should be read-only")
+    assert second.parameters["alpha"] == 0.04
+
+    info = first.get_model_info()
+    info["parameters"]["alpha"] = 0.5
+    assert second.parameters["alpha"] == 0.04
+
+    with warnings.catch_warnings(record=True) as caught:
+        warnings.simplefilter("always")
+        create_dose_response_model("beta_binomial", {"alpha": 0.04, "beta": 0.055})
+    assert any("Beta-Binomial model is appropriate" in str(w.message) for w in caught)
+
+
+if __name__ == "__main__":
+    test_beta_binomial_table_matches_formula()
+    test_beta_binomial_dose_for_risk_inverts_model()
+    test_beta_binomial_dose_for_risk_at_grid_ends()
+    test_batch_probabilities_match_per_model()
+    test_scalar_doses_match_array_path()
+    test_low_dose_risk_keeps_precision()
+    test_beta_poisson_float32_path()
+    test_out_buffer_matches_fresh_result()
+    test_factory_shares_models_per_parameter_set()
+    test_factory_models_cannot_affect_each_other()
+    print("[OK] Dose-response fast paths match the formulas")
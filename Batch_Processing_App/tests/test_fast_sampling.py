@@ -0,0 +1,76 @@
+#!/usr/bin/env python3
+"""
+Test the compiled sampling fast path against the reference implementations.
+
+The fast path (qmra_core.fast_sampling) must give the same samples and
+infection probabilities as the default code so the use_numba switch never
+changes assessment results.
+"""
+
+import sys
+import warnings
+from pathlib import Path
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from qmra_core import MonteCarloSimulator, create_hockey_stick_distribution
+from qmra_core.dose_response import BetaBinomialModel, BetaPoissonModel
+from qmra_core.fast_sampling import (
+    NUMBA_AVAILABLE,
+    beta_binomial_probability,
+    beta_poisson_probability
+)
+
+
+def test_hockey_stick_fast_path_matches_loop():
+    """Seeded Hockey Stick samples are identical with and without the kernel."""
+    dist = create_hockey_stick_distribution(x_min=200, x_median=1026, x_max=3484, P=0.95)
+
+    reference = MonteCarloSimulator(random_seed=42)
+    reference.add_distribution("conc", dist)
+    expected = reference.sample_distribution("conc", 20000)
+
+    fast = MonteCarloSimulator(random_seed=42)
+    fast.use_numba = True  # exercise the kernel even where Numba is missing
+    fast.add_distribution("conc", dist)
+    actual = fast.sample_distribution("conc", 20000)
+
+    np.testing.assert_allclose(actual, expected, rtol=1e-12)
+    assert actual.min() >= 200 and actual.max() <= 3484
+
+
+def test_beta_binomial_kernel_matches_model():
+    """Compiled Beta-Binomial matches BetaBinomialModel for integer doses."""
+    model = BetaBinomialModel({"alpha": 0.04, "beta": 0.055})
+    doses = np.array([0, 1, 2, 5, 10, 100, 1000, 100000])
+
+    np.testing.assert_allclose(beta_binomial_probability(doses, 0.04, 0.055),
+                               model.calculate_infection_probability(doses), rtol=1e-10, atol=1e-12)
+
+
+def test_beta_poisson_kernel_matches_model():
+    """Compiled Beta-Poisson matches BetaPoissonModel across the dose range."""
+    model = BetaPoissonModel({"alpha": 0.145, "beta": 7.59})
+    doses = np.array([0.0, 0.01, 0.5, 1.0, 10.0, 1e3, 1e6])
+
+    np.testing.assert_allclose(beta_poisson_probability(doses, 0.145, 7.59),
+                               model.calculate_infection_probability(doses), rtol=1e-12)
+
+
+def test_use_numba_requires_numba():
+    """Without Numba the simulator keeps the NumPy path instead of Python loops."""
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore", RuntimeWarning)
+        simulator = MonteCarloSimulator(random_seed=42, use_numba=True)
+
+    assert simulator.use_numba == NUMBA_AVAILABLE
+
+
+if __name__ == "__main__":
+    test_hockey_stick_fast_path_matches_loop()
+    test_beta_binomial_kernel_matches_model()
+    test_beta_poisson_kernel_matches_model()
+    test_use_numba_requires_numba()
+    print("[OK] Fast sampling matches reference implementations")
@@ -0,0 +1,66 @@
+#!/usr/bin/env python3
+"""
+Test the vectorized paths of the illness model.
+
+apply_illness_model_to_dataframe classifies whole columns at once; each row
+must get the same labels that classify_illness_risk and
+get_who_compliance_status give for that value. Binary infection status must
+only ever turn into illness for infected individuals.
+"""
+
+import sys
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from qmra_core import (
+    apply_illness_model_to_dataframe,
+    classify_illness_risk,
+    get_who_compliance_status,
+    get_who_compliance_status_vec,
+    infection_to_illness
+)
+
+
+def test_dataframe_classification_matches_helpers():
+    """Threshold edges, NaN and extremes classify exactly as the scalar helpers."""
+    risks = [0.0, 5e-7, 1e-6, 5e-5, 1e-4, 1.0001e-4, 1e-3, 5e-3, 1e-2, 0.5, np.nan]
+    df = pd.DataFrame({'Mean_Annual_Risk': risks})
+
+    result = apply_illness_model_to_dataframe(df, 1.0)
+
+    assert result['Illness_Classification'].tolist() == [classify_illness_risk(x) for x in risks]
+    assert result['WHO_Compliance'].tolist() == [get_who_compliance_status(x)[0] for x in risks]
+    assert 'Illness_Classification' not in df.columns
+
+
+def test_vectorized_compliance_matches_scalar():
+    """Array compliance returns the same statuses and flags as the scalar helper."""
+    risks = np.array([0.0, 5e-5, 1e-4, 1.0001e-4, 0.3, np.nan])
+
+    statuses, compliant = get_who_compliance_status_vec(risks, guideline_threshold=1e-4)
+
+    expected = [get_who_compliance_status(x) for x in risks]
+    assert statuses.tolist() == [status for status, _ in expected]
+    assert compliant.tolist() == [flag for _, flag in expected]
+
+
+def test_binary_illness_only_for_infected():
+    """Dense and sparse infection patterns both leave the uninfected well."""
+    rng = np.random.default_rng(0)
+    for rate in (0.3, 0.001):
+        infected = (rng.random(200000) < rate).astype(int)
+        illness = infection_to_illness(infected, 0.60, 0.74, seed=42)
+
+        assert not illness[infected == 0].any()
+        assert abs(illness[infected == 1].mean() - 0.60 * 0.74) < 0.05
+
+
+if __name__ == "__main__":
+    test_dataframe_classification_matches_helpers()
+    test_vectorized_compliance_matches_scalar()
+    test_binary_illness_only_for_infected()
+    print("[OK] Illness model vectorized paths behave as expected")
@@ -201,7 +201,8 @@ class NZConsultancyQMRA:
             aggfunc='mean'
         )
 
-        summary_table.to_csv(self.output_dir / "risk_summary_table.csv")
+        # 4 significant digits is plenty for summary tables and keeps the CSVs small
+        summary_table.to_csv(self.output_dir / "risk_summary_table.csv", float_format='%.4g')
 
         # Calculate risk reduction benefits
         self._calculate_risk_reduction_benefits(comparison_df)
@@ -15,8 +15,8 @@ Author: NIWA Earth Sciences New Zealand
 Date: October 2025
 """
 
-from .pathogen_database import PathogenDatabase, get_norovirus_parameters
-from .dose_response import create_dose_response_model
+from .pathogen_database import PathogenDatabase, get_pathogen_database, get_norovirus_parameters
+from .dose_response import create_dose_response_model, get_default_dose_response_model
 from .monte_carlo import (
     MonteCarloSimulator,
     create_lognormal_distribution,
@@ -25,7 +25,8 @@ from .monte_carlo import (
     create_empirical_cdf_from_data,
     create_empirical_cdf_distribution,
     create_hockey_stick_distribution,
-    calculate_empirical_cdf
+    calculate_empirical_cdf,
+    spawn_generators
 )
 from .exposure_parameters import (
     BioaccumulationFactor,
@@ -42,14 +43,17 @@ from .illness_model import (
     calculate_population_illness_cases,
     classify_illness_risk,
     get_who_compliance_status,
+    get_who_compliance_status_vec,
     apply_illness_model_to_dataframe
 )
 
 __version__ = "1.2.0"
 __all__ = [
     "PathogenDatabase",
+    "get_pathogen_database",
     "get_norovirus_parameters",
     "create_dose_response_model",
+    "get_default_dose_response_model",
     "MonteCarloSimulator",
     "create_lognormal_distribution",
     "create_uniform_distribution",
@@ -58,6 +62,7 @@ __all__ = [
     "create_empirical_cdf_distribution",
     "create_hockey_stick_distribution",
     "calculate_empirical_cdf",
+    "spawn_generators",
     "BioaccumulationFactor",
     "ShellfishMealSize",
     "calculate_shellfish_water_equivalent",
@@ -70,5 +75,6 @@ __all__ = [
     "calculate_population_illness_cases",
     "classify_illness_risk",
     "get_who_compliance_status",
+    "get_who_compliance_status_vec",
     "apply_illness_model_to_dataframe"
 ]
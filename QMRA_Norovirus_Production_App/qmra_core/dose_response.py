@@ -5,14 +5,33 @@ This module implements dose-response models for calculating infection probabilit
 from pathogen exposure doses, including Beta-Poisson and exponential models.
 """
 
+import math
 import numpy as np
+from functools import lru_cache
+from types import MappingProxyType
 from typing import Union, Dict, Optional
-from scipy.special import gamma, gammaln, hyp2f1
+from scipy.optimize import brentq
+from scipy.special import gammaln
 import warnings
 
 
+# Discretized Monte Carlo doses are small non-negative integers, so the
+# Beta-Binomial probabilities for doses below this bound are tabulated once
+BETA_BINOMIAL_TABLE_SIZE = 4096
+
+# Large dose arrays are evaluated in blocks of this many elements so the
+# intermediate arrays stay cache-resident
+DOSE_BLOCK_SIZE = 1 << 16
+
+
+def _has_negative_doses(dose: np.ndarray) -> bool:
+    """Check for negative doses with one reduction and no temporary mask."""
+    return dose.size > 0 and dose.min() < 0
+
+
 def discretize_fractional_dose(dose: Union[float, np.ndarray],
-                               use_excel_method: bool = True) -> Union[float, np.ndarray]:
+                               use_excel_method: bool = True,
+                               rng: Optional[np.random.Generator] = None) -> Union[float, np.ndarray]:
     """
     Discretize fractional doses using Excel's INT + Binomial method.
 
@@ -30,6 +49,10 @@ def discretize_fractional_dose(dose: Union[float, np.ndarray],
     Args:
         dose: Dose in organisms (can be fractional)
         use_excel_method: If True, use Excel's discretization. If False, return continuous dose.
+        rng: Dedicated random Generator for the Binomial draws. If None, the
+            global np.random state is used so seeded runs stay reproducible.
+            With a Generator the Bernoulli(p) draws are made as a single
+            uniform comparison, which is several times faster.
 
     Returns:
         Discretized dose (integer for single value, integer array for array input)
@@ -40,20 +63,25 @@ def discretize_fractional_dose(dose: Union[float, np.ndarray],
     if not use_excel_method:
         return dose
 
-    dose = np.atleast_1d(dose).astype(float)
+    # Float input is used as is; only other dtypes are converted
+    dose = np.atleast_1d(np.asarray(dose, dtype=float))
 
     # Integer part
-    integer_part = np.floor(dose).astype(int)
+    integer_part = np.floor(dose)
 
     # Fractional part
     fractional_part = dose - integer_part
 
     # Binomial sampling for fractional organisms
     # Each fractional part has probability equal to the fraction
-    fractional_organisms = np.random.binomial(1, fractional_part)
-
-    # Combine
-    discretized = integer_part + fractional_organisms
+    # Combine in place rather than allocating a separate sum
+    discretized = integer_part.astype(int)
+    if rng is None:
+        # The legacy Binomial sampler defines the validated seeded results
+        discretized += np.random.binomial(1, fractional_part)
+    else:
+        # Bernoulli(p) is one uniform draw compared against p
+        discretized += rng.random(fractional_part.shape) < fractional_part
 
     return discretized if discretized.size > 1 else int(discretized[0])
 
@@ -61,20 +89,28 @@ def discretize_fractional_dose(dose: Union[float, np.ndarray],
 class DoseResponseModel:
     """Base class for dose-response models."""
 
-    def __init__(self, parameters: Dict):
+    def __init__(self, parameters: Dict, warn: bool = True):
         """
         Initialize dose-response model.
 
         Args:
             parameters: Dictionary containing model parameters
+            warn: Emit parameter warnings now (the factory defers them so
+                every call, not just the first, reports them)
         """
         self.parameters = parameters
         self.validate_parameters()
+        if warn:
+            self.warn_parameters()
 
     def validate_parameters(self) -> None:
         """Validate model parameters. Should be implemented by subclasses."""
         pass
 
+    def warn_parameters(self) -> None:
+        """Warn about valid but questionable parameters. Overridden by subclasses."""
+        pass
+
     def calculate_infection_probability(self, dose: Union[float, np.ndarray]) -> Union[float, np.ndarray]:
         """
         Calculate infection probability from dose.
@@ -91,7 +127,7 @@ class DoseResponseModel:
         """Get model information including parameters and citation."""
         return {
             "model_type": self.__class__.__name__,
-            "parameters": self.parameters,
+            "parameters": dict(self.parameters),
             "citation": self.parameters.get("source", "No citation available")
         }
 
@@ -117,34 +153,83 @@ class BetaPoissonModel(DoseResponseModel):
         if self.parameters["beta"] <= 0:
             raise ValueError("Beta parameter must be positive")
 
-    def calculate_infection_probability(self, dose: Union[float, np.ndarray]) -> Union[float, np.ndarray]:
+    def calculate_infection_probability(self, dose: Union[float, np.ndarray],
+                                        dtype: Optional[np.dtype] = None,
+                                        out: Optional[np.ndarray] = None) -> Union[float, np.ndarray]:
         """
         Calculate infection probability using Beta-Poisson model.
 
         Args:
             dose: Pathogen dose (organisms)
+            dtype: Floating dtype to evaluate in. np.float32 halves memory
+                traffic for very large Monte Carlo arrays; the log1p/expm1
+                form keeps about 7 significant digits even at low risk.
+                If None, the dose's own precision (float64 by default) is used.
+            out: Preallocated float array of the dose's shape to write the
+                probabilities into, e.g. reused across Monte Carlo runs.
+                Ignored for single int/float doses.
 
         Returns:
             Probability of infection (0-1)
         """
-        dose = np.asarray(dose)
         alpha = self.parameters["alpha"]
         beta = self.parameters["beta"]
 
+        # Single doses skip the array machinery entirely
+        if dtype is None and isinstance(dose, (int, float)):
+            if dose < 0:
+                warnings.warn("Negative doses encountered, setting to zero")
+                dose = 0.0
+            return -math.expm1(-alpha * math.log1p(dose / beta))
+
+        dose = np.asarray(dose, dtype=dtype)
+        if dtype is not None:
+            # Keep the parameters from promoting the arithmetic back to float64
+            alpha = dose.dtype.type(alpha)
+            beta = dose.dtype.type(beta)
+
         # Handle zero and negative doses
-        if np.any(dose < 0):
+        if _has_negative_doses(dose):
             warnings.warn("Negative doses encountered, setting to zero")
             dose = np.maximum(dose, 0)
 
-        # Beta-Poisson formula: P = 1 - (1 + dose/beta)^(-alpha)
-        with np.errstate(over='warn', divide='warn'):
-            prob = 1 - np.power(1 + dose / beta, -alpha)
+        # Beta-Poisson formula: P = 1 - (1 + dose/beta)^(-alpha), written with
+        # log1p/expm1 so low-dose risks keep full precision instead of
+        # cancelling in 1 - x (the result already lies in [0, 1])
+        if out is not None:
+            np.divide(dose, beta, out=out)
+            np.log1p(out, out=out)
+            np.multiply(-alpha, out, out=out)
+            np.expm1(out, out=out)
+            return np.negative(out, out=out)
 
-        # Ensure probabilities are in valid range [0, 1]
-        prob = np.clip(prob, 0, 1)
+        prob = -np.expm1(-alpha * np.log1p(dose / beta))
 
         return prob if prob.shape else float(prob)
 
+    @staticmethod
+    def calculate_infection_probability_batch(dose: np.ndarray, alphas: np.ndarray,
+                                              betas: np.ndarray) -> np.ndarray:
+        """
+        Calculate Beta-Poisson infection probabilities for many parameter sets at once.
+
+        Broadcasts the doses against every (alpha, beta) pair so parameter
+        sweeps run as one array expression instead of one model per pair.
+
+        Args:
+            dose: Pathogen doses (organisms)
+            alphas: Alpha parameter for each parameter set
+            betas: Beta parameter for each parameter set
+
+        Returns:
+            Array of shape (n_parameter_sets, n_doses) of infection probabilities
+        """
+        d = np.maximum(np.atleast_1d(np.asarray(dose, dtype=float)), 0)[None, :]
+        a = np.asarray(alphas, dtype=float).reshape(-1, 1)
+        b = np.asarray(betas, dtype=float).reshape(-1, 1)
+
+        return -np.expm1(-a * np.log1p(d / b))
+
     def calculate_dose_for_risk(self, target_risk: float) -> float:
         """
         Calculate dose required to achieve target infection risk.
@@ -163,7 +248,7 @@ class BetaPoissonModel(DoseResponseModel):
 
         # Solve: target_risk = 1 - (1 + dose/beta)^(-alpha)
         # Rearranged: dose = beta * ((1 - target_risk)^(-1/alpha) - 1)
-        dose = beta * (np.power(1 - target_risk, -1/alpha) - 1)
+        dose = beta * np.expm1(-np.log1p(-target_risk) / alpha)
         return float(dose)
 
 
@@ -184,29 +269,44 @@ class ExponentialModel(DoseResponseModel):
         if self.parameters["r"] <= 0:
             raise ValueError("r parameter must be positive")
 
-    def calculate_infection_probability(self, dose: Union[float, np.ndarray]) -> Union[float, np.ndarray]:
+    def calculate_infection_probability(self, dose: Union[float, np.ndarray],
+                                        out: Optional[np.ndarray] = None) -> Union[float, np.ndarray]:
         """
         Calculate infection probability using exponential model.
 
         Args:
             dose: Pathogen dose (organisms)
+            out: Preallocated float array of the dose's shape to write the
+                probabilities into, e.g. reused across Monte Carlo runs.
+                Ignored for single int/float doses.
 
         Returns:
             Probability of infection (0-1)
         """
-        dose = np.asarray(dose)
         r = self.parameters["r"]
 
+        # Single doses skip the array machinery entirely
+        if isinstance(dose, (int, float)):
+            if dose < 0:
+                warnings.warn("Negative doses encountered, setting to zero")
+                dose = 0.0
+            return -math.expm1(-r * dose)
+
+        dose = np.asarray(dose)
+
         # Handle zero and negative doses
-        if np.any(dose < 0):
+        if _has_negative_doses(dose):
             warnings.warn("Negative doses encountered, setting to zero")
             dose = np.maximum(dose, 0)
 
-        # Exponential formula: P = 1 - exp(-r * dose)
-        prob = 1 - np.exp(-r * dose)
+        # Exponential formula: P = 1 - exp(-r * dose), via expm1 to avoid
+        # cancellation at small r * dose
+        if out is not None:
+            np.multiply(-r, dose, out=out)
+            np.expm1(out, out=out)
+            return np.negative(out, out=out)
 
-        # Ensure probabilities are in valid range [0, 1]
-        prob = np.clip(prob, 0, 1)
+        prob = -np.expm1(-r * dose)
 
         return prob if prob.shape else float(prob)
 
@@ -227,7 +327,7 @@ class ExponentialModel(DoseResponseModel):
 
         # Solve: target_risk = 1 - exp(-r * dose)
         # Rearranged: dose = -ln(1 - target_risk) / r
-        dose = -np.log(1 - target_risk) / r
+        dose = -np.log1p(-target_risk) / r
         return float(dose)
 
 
@@ -269,7 +369,18 @@ class BetaBinomialModel(DoseResponseModel):
         if self.parameters["beta"] <= 0:
             raise ValueError("Beta parameter must be positive")
 
-        # Check if Beta-Poisson approximation would be invalid
+        alpha = self.parameters["alpha"]
+        beta = self.parameters["beta"]
+
+        # The dose-independent log-gamma terms are fixed by the parameters,
+        # so evaluate them once rather than on every probability call
+        self._gl_alpha_beta = float(gammaln(alpha + beta))
+        self._gl_beta = float(gammaln(beta))
+        self._pinf_table = self._infection_probability(np.arange(BETA_BINOMIAL_TABLE_SIZE))
+        self._risk_grid = None
+
+    def warn_parameters(self) -> None:
+        """Point out that Beta-Poisson would be invalid for these parameters."""
         alpha = self.parameters["alpha"]
         beta = self.parameters["beta"]
         if beta < 1:
@@ -280,7 +391,8 @@ class BetaBinomialModel(DoseResponseModel):
                 category=UserWarning
             )
 
-    def calculate_infection_probability(self, dose: Union[float, np.ndarray]) -> Union[float, np.ndarray]:
+    def calculate_infection_probability(self, dose: Union[float, np.ndarray],
+                                        out: Optional[np.ndarray] = None) -> Union[float, np.ndarray]:
         """
         Calculate infection probability using Beta-Binomial model.
 
@@ -293,6 +405,9 @@ class BetaBinomialModel(DoseResponseModel):
 
         Args:
             dose: Pathogen dose (organisms/virions)
+            out: Preallocated float array of the dose's shape to write the
+                probabilities into, e.g. reused across Monte Carlo runs.
+                Ignored for single int/float doses.
 
         Returns:
             Probability of infection (0-1)
@@ -302,31 +417,108 @@ class BetaBinomialModel(DoseResponseModel):
             >>> prob = model.calculate_infection_probability(1)
             >>> # prob ≈ 0.421 (42.1% infection probability for 1 norovirus virion)
         """
+        # Single doses skip the array machinery entirely
+        if isinstance(dose, (int, float)):
+            if dose < 0:
+                warnings.warn("Negative doses encountered, setting to zero")
+                dose = 0
+            if isinstance(dose, int) and dose < BETA_BINOMIAL_TABLE_SIZE:
+                return float(self._pinf_table[int(dose)])
+
+            alpha = self.parameters["alpha"]
+            beta = self.parameters["beta"]
+            # SciPy's gammaln and NumPy's exp keep results identical to arrays
+            log_prob_complement = (
+                gammaln(beta + dose) +
+                self._gl_alpha_beta -
+                gammaln(alpha + beta + dose) -
+                self._gl_beta
+            )
+            return min(max(1.0 - float(np.exp(log_prob_complement)), 0.0), 1.0)
+
         dose = np.asarray(dose)
-        alpha = self.parameters["alpha"]
-        beta = self.parameters["beta"]
+
+        # Integer doses within the table are a plain lookup
+        if (dose.dtype.kind in "iu" and dose.size
+                and dose.min() >= 0 and dose.max() < BETA_BINOMIAL_TABLE_SIZE):
+            if out is not None:
+                return np.take(self._pinf_table, dose, out=out)
+            prob = self._pinf_table[dose]
+            return prob if prob.shape else float(prob)
 
         # Handle zero and negative doses
-        if np.any(dose < 0):
+        if _has_negative_doses(dose):
             warnings.warn("Negative doses encountered, setting to zero")
             dose = np.maximum(dose, 0)
 
+        if out is not None:
+            out[...] = self._infection_probability(dose)
+            return out
+
+        prob = self._infection_probability(dose)
+
+        return prob if prob.shape else float(prob)
+
+    def _infection_probability(self, dose: np.ndarray) -> np.ndarray:
+        """Evaluate the Beta-Binomial formula for non-negative doses."""
+        dose = np.asarray(dose)
+        if dose.size <= DOSE_BLOCK_SIZE:
+            return self._infection_probability_block(dose)
+
+        # Large arrays are evaluated in blocks so the temporaries stay in cache
+        flat_dose = dose.ravel()
+        prob = np.empty(flat_dose.shape)
+        for start in range(0, flat_dose.size, DOSE_BLOCK_SIZE):
+            stop = start + DOSE_BLOCK_SIZE
+            prob[start:stop] = self._infection_probability_block(flat_dose[start:stop])
+
+        return prob.reshape(dose.shape)
+
+    def _infection_probability_block(self, dose: np.ndarray) -> np.ndarray:
+        """Evaluate the Beta-Binomial formula for one block of doses."""
+        alpha = self.parameters["alpha"]
+        beta = self.parameters["beta"]
+
         # Beta-Binomial formula using log-gamma functions
         # This avoids numerical overflow/underflow issues with large gamma values
-        log_prob_complement = (
-            gammaln(beta + dose) +
-            gammaln(alpha + beta) -
-            gammaln(alpha + beta + dose) -
-            gammaln(beta)
-        )
+        # gammaln returns a scalar for 0-d input; keep an array for the in-place steps
+        log_prob_complement = np.asarray(gammaln(beta + dose))
+        log_prob_complement += self._gl_alpha_beta
+        log_prob_complement -= gammaln(alpha + beta + dose)
+        log_prob_complement -= self._gl_beta
 
-        # Calculate probability
-        prob = 1.0 - np.exp(log_prob_complement)
+        # Calculate probability, reusing the same buffer
+        prob = np.exp(log_prob_complement, out=log_prob_complement)
+        np.subtract(1.0, prob, out=prob)
 
         # Ensure probabilities are in valid range [0, 1]
-        prob = np.clip(prob, 0, 1)
+        return np.clip(prob, 0, 1, out=prob)
 
-        return prob if prob.shape else float(prob)
+    @staticmethod
+    def calculate_infection_probability_batch(dose: np.ndarray, alphas: np.ndarray,
+                                              betas: np.ndarray) -> np.ndarray:
+        """
+        Calculate Beta-Binomial infection probabilities for many parameter sets at once.
+
+        Broadcasts the doses against every (alpha, beta) pair so parameter
+        sweeps run as one array expression instead of one model per pair.
+
+        Args:
+            dose: Pathogen doses (organisms/virions)
+            alphas: Alpha parameter for each parameter set
+            betas: Beta parameter for each parameter set
+
+        Returns:
+            Array of shape (n_parameter_sets, n_doses) of infection probabilities
+        """
+        d = np.maximum(np.atleast_1d(np.asarray(dose, dtype=float)), 0)[None, :]
+        a = np.asarray(alphas, dtype=float).reshape(-1, 1)
+        b = np.asarray(betas, dtype=float).reshape(-1, 1)
+
+        # Same summation order as calculate_infection_probability
+        log_prob_complement = gammaln(b + d) + gammaln(a + b) - gammaln(a + b + d) - gammaln(b)
+
+        return np.clip(1.0 - np.exp(log_prob_complement), 0, 1)
 
     def calculate_dose_for_risk(self, target_risk: float) -> float:
         """
@@ -343,17 +535,28 @@ class BetaBinomialModel(DoseResponseModel):
         if not 0 < target_risk < 1:
             raise ValueError("Target risk must be between 0 and 1")
 
-        from scipy.optimize import brentq
-
         def risk_difference(dose):
             return self.calculate_infection_probability(dose) - target_risk
 
-        # Search for dose between 0 and 10^6 organisms
+        # Search for dose between 0 and 10^6 organisms. A (dose, risk) grid
+        # built on first use usually brackets the root, so brentq only refines
+        # one grid interval instead of the whole range
+        if self._risk_grid is None:
+            dose_grid = np.concatenate([[0.0], np.logspace(-3, 6, 4096)])
+            self._risk_grid = (dose_grid, self._infection_probability(dose_grid))
+        dose_grid, risk_grid = self._risk_grid
+
+        i = min(max(int(np.searchsorted(risk_grid, target_risk)), 1), len(risk_grid) - 1)
         try:
-            dose = brentq(risk_difference, 0, 1e6)
-            return float(dose)
+            dose = brentq(risk_difference, dose_grid[i - 1], dose_grid[i])
         except ValueError:
-            raise ValueError(f"Could not find dose for target risk {target_risk}")
+            # The grid interval does not bracket the target (beyond either end
+            # of the grid, or a plateau); search the full range instead
+            try:
+                dose = brentq(risk_difference, 0, 1e6)
+            except ValueError:
+                raise ValueError(f"Could not find dose for target risk {target_risk}")
+        return float(dose)
 
 
 class HypergeometricModel(DoseResponseModel):
@@ -388,8 +591,7 @@ class HypergeometricModel(DoseResponseModel):
         dose = np.asarray(dose)
         dose = np.maximum(dose, 0)
 
-        prob = 1 - np.power(1 + dose / beta, -alpha)
-        prob = np.clip(prob, 0, 1)
+        prob = -np.expm1(-alpha * np.log1p(dose / beta))
 
         return prob if prob.shape else float(prob)
 
@@ -401,14 +603,28 @@ class HypergeometricModel(DoseResponseModel):
         if not 0 < target_risk < 1:
             raise ValueError("Target risk must be between 0 and 1")
 
-        dose = beta * (np.power(1 - target_risk, -1/alpha) - 1)
+        dose = beta * np.expm1(-np.log1p(-target_risk) / alpha)
         return float(dose)
 
 
+MODEL_TYPES = {
+    "beta_binomial": BetaBinomialModel,
+    "beta_poisson": BetaPoissonModel,
+    "exponential": ExponentialModel,
+    "hypergeometric": HypergeometricModel
+}
+
+
 def create_dose_response_model(model_type: str, parameters: Dict) -> DoseResponseModel:
     """
     Factory function to create dose-response models.
 
+    Models with the same type and parameters are built once and shared, so
+    sensitivity loops do not repeat validation and the precomputed tables.
+    Shared models hold their parameters in a read-only mapping, so one
+    caller cannot change the model another caller gets; parameter warnings
+    are still issued on every call.
+
     Args:
         model_type: Type of model ("beta_binomial", "beta_poisson", "exponential", "hypergeometric")
         parameters: Model parameters
@@ -423,19 +639,46 @@ def create_dose_response_model(model_type: str, parameters: Dict) -> DoseRespons
         For norovirus, use "beta_binomial" (EXACT model) instead of "beta_poisson" (invalid approximation).
         Beta-Poisson approximation is only valid when β >> 1.
     """
-    model_types = {
-        "beta_binomial": BetaBinomialModel,
-        "beta_poisson": BetaPoissonModel,
-        "exponential": ExponentialModel,
-        "hypergeometric": HypergeometricModel
-    }
-
-    if model_type.lower() not in model_types:
-        available = ", ".join(model_types.keys())
+    if model_type.lower() not in MODEL_TYPES:
+        available = ", ".join(MODEL_TYPES.keys())
         raise ValueError(f"Unknown model type: {model_type}. Available: {available}")
 
-    model_class = model_types[model_type.lower()]
-    return model_class(parameters)
+    try:
+        model = _create_cached_model(model_type.lower(), tuple(sorted(parameters.items())))
+    except TypeError:
+        # Unhashable parameter values cannot be cached
+        return MODEL_TYPES[model_type.lower()](parameters)
+    model.warn_parameters()
+    return model
+
+
+@lru_cache(maxsize=256)
+def _create_cached_model(model_type: str, parameter_items: tuple) -> DoseResponseModel:
+    """Build a shared model from hashable parameters, with read-only parameters."""
+    return MODEL_TYPES[model_type](MappingProxyType(dict(parameter_items)), warn=False)
+
+
+@lru_cache(maxsize=None)
+def get_default_dose_response_model(pathogen_name: str) -> DoseResponseModel:
+    """
+    Get the default dose-response model for a pathogen, built once per process.
+
+    Uses the pathogen's default model type and parameters from the shared
+    pathogen database. Models hold only their parameters, so the cached
+    instance can be reused across scenarios and assessments.
+
+    Args:
+        pathogen_name: Name of the pathogen
+
+    Returns:
+        Dose-response model instance
+    """
+    from .pathogen_database import get_pathogen_database
+
+    pathogen_db = get_pathogen_database()
+    model_type = pathogen_db.get_default_model_type(pathogen_name)
+    parameters = pathogen_db.get_dose_response_parameters(pathogen_name, model_type)
+    return create_dose_response_model(model_type, parameters)
 
 
 def calculate_illness_probability(infection_prob: Union[float, np.ndarray],
@@ -0,0 +1,164 @@
+"""
+Fast Sampling Kernels for QMRA Toolkit
+
+This module provides compiled inner loops for the hot paths of the batch
+Monte Carlo pipeline: Hockey Stick inverse-CDF sampling and the Beta-Binomial
+and Beta-Poisson dose-response models. Numba is an optional dependency.
+Without it the kernels are plain per-element Python loops, far slower than
+the vectorized NumPy code they replace; they stay importable only so the
+results can be checked, and callers should go through resolve_use_numba()
+so use_numba falls back to the NumPy path.
+"""
+
+import math
+import warnings
+
+import numpy as np
+
+try:
+    from numba import njit, prange
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+    prange = range
+
+    def njit(*args, **kwargs):
+        """Fallback decorator that leaves the function uncompiled."""
+        def decorator(func):
+            return func
+        return decorator
+
+
+# Warn once per process when use_numba is requested without Numba
+_missing_numba_warned = False
+
+
+def resolve_use_numba(use_numba):
+    """
+    Return whether the compiled kernels should actually be used.
+
+    Without Numba the kernels would run as pure-Python loops, so use_numba
+    is turned off (with a one-time warning) and callers keep the NumPy path.
+    """
+    global _missing_numba_warned
+    if use_numba and not NUMBA_AVAILABLE:
+        if not _missing_numba_warned:
+            warnings.warn("Numba is not installed; use_numba is ignored and the NumPy "
+                          "implementation is used instead.", RuntimeWarning)
+            _missing_numba_warned = True
+        return False
+    return bool(use_numba)
+
+
+@njit(parallel=True, cache=True)
+def _hockey_stick_kernel(u, x_min, x_median, x_p, x_max, P, h1, h2, m1, m2, m3, out):
+    """Map uniform draws onto the Hockey Stick inverse CDF in place."""
+    for i in prange(u.shape[0]):
+        ui = u[i]
+
+        if ui <= 0.5:
+            # Section 1 (X₀ to X₅₀): x = X₀ + sqrt(2*u / m1)
+            x = x_min + math.sqrt(2.0 * ui / m1) if m1 > 0 else x_min
+
+        elif ui <= P:
+            # Section 2 (X₅₀ to X_P): m2/2 * d² + h1 * d - (u - 0.5) = 0
+            u_scaled = ui - 0.5
+            if m2 != 0:
+                disc = h1 * h1 + 2.0 * m2 * u_scaled
+                x = x_median + (-h1 + math.sqrt(disc)) / m2 if disc >= 0 else x_median
+            else:
+                x = x_median + u_scaled / h1 if h1 > 0 else x_median
+
+        else:
+            # Section 3 (X_P to X₁₀₀): m3/2 * d² + h2 * d - (u - P) = 0
+            u_scaled = ui - P
+            if m3 != 0:
+                disc = h2 * h2 + 2.0 * m3 * u_scaled
+                x = x_p + (-h2 + math.sqrt(disc)) / m3 if disc >= 0 else x_p
+            else:
+                x = x_p + u_scaled / h2 if h2 > 0 else x_p
+
+        out[i] = min(max(x, x_min), x_max)
+
+    return out
+
+
+@njit(parallel=True, cache=True)
+def _beta_binomial_kernel(dose, alpha, beta, out):
+    """Evaluate the Beta-Binomial infection probability in place."""
+    lgamma_ab = math.lgamma(alpha + beta)
+    lgamma_b = math.lgamma(beta)
+    for i in prange(dose.shape[0]):
+        d = max(dose[i], 0.0)
+        # Same summation order as BetaBinomialModel to keep large-dose cancellation identical
+        log_complement = math.lgamma(beta + d) + lgamma_ab - math.lgamma(alpha + beta + d) - lgamma_b
+        prob = 1.0 - math.exp(log_complement)
+        out[i] = min(max(prob, 0.0), 1.0)
+
+    return out
+
+
+@njit(parallel=True, cache=True)
+def _beta_poisson_kernel(dose, alpha, beta, out):
+    """Evaluate the Beta-Poisson infection probability in place."""
+    for i in prange(dose.shape[0]):
+        d = max(dose[i], 0.0)
+        out[i] = -math.expm1(-alpha * math.log1p(d / beta))
+
+    return out
+
+
+def hockey_stick_from_uniform(u: np.ndarray, x_min: float, x_median: float, x_p: float,
+                              x_max: float, P: float, h1: float, h2: float,
+                              m1: float, m2: float, m3: float) -> np.ndarray:
+    """
+    Transform uniform draws into Hockey Stick samples.
+
+    Args:
+        u: Uniform(0, 1) draws, one per sample
+        x_min, x_median, x_p, x_max: Distribution breakpoints (X₀, X₅₀, X_P, X₁₀₀)
+        P: Breakpoint percentile
+        h1, h2: PDF peak heights at X₅₀ and X_P
+        m1, m2, m3: PDF slopes for the three sections
+
+    Returns:
+        Array of concentration samples clipped to [x_min, x_max]
+    """
+    u = np.ascontiguousarray(u, dtype=np.float64)
+    out = np.empty_like(u)
+    return _hockey_stick_kernel(u, float(x_min), float(x_median), float(x_p), float(x_max),
+                                float(P), float(h1), float(h2), float(m1), float(m2), float(m3), out)
+
+
+def beta_binomial_probability(dose: np.ndarray, alpha: float, beta: float) -> np.ndarray:
+    """
+    Calculate Beta-Binomial infection probabilities for an array of doses.
+
+    Args:
+        dose: Pathogen doses (organisms/virions)
+        alpha: Beta-Binomial alpha parameter
+        beta: Beta-Binomial beta parameter
+
+    Returns:
+        Probability of infection (0-1) for each dose
+    """
+    dose = np.ascontiguousarray(np.atleast_1d(dose), dtype=np.float64)
+    out = np.empty_like(dose)
+    return _beta_binomial_kernel(dose, float(alpha), float(beta), out)
+
+
+def beta_poisson_probability(dose: np.ndarray, alpha: float, beta: float) -> np.ndarray:
+    """
+    Calculate Beta-Poisson infection probabilities for an array of doses.
+
+    Args:
+        dose: Pathogen doses (organisms)
+        alpha: Beta-Poisson alpha parameter
+        beta: Beta-Poisson beta parameter
+
+    Returns:
+        Probability of infection (0-1) for each dose
+    """
+    dose = np.ascontiguousarray(np.atleast_1d(dose), dtype=np.float64)
+    out = np.empty_like(dose)
+    return _beta_poisson_kernel(dose, float(alpha), float(beta), out)
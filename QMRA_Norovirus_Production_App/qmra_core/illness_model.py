@@ -23,10 +23,21 @@ from typing import Union, Dict, Optional, Tuple
 import warnings
 
 
+# Lower bounds of the illness risk classes above "Negligible", in the order
+# used by classify_illness_risk, for classifying whole columns at once
+_ILLNESS_RISK_THRESHOLDS = np.array([1e-6, 1e-4, 1e-3, 1e-2])
+_ILLNESS_RISK_LABELS = np.array(["Negligible", "Very Low", "Low", "Medium", "High"], dtype=object)
+
+# Below this infected fraction, binary illness draws are made only for the
+# infected individuals instead of for the whole population
+SPARSE_INFECTION_FRACTION = 0.01
+
+
 def infection_to_illness(infection_status: Union[np.ndarray, pd.Series],
                         probability_illness_given_infection: float,
                         population_susceptibility: float = 1.0,
-                        seed: Optional[int] = None) -> Union[np.ndarray, pd.Series]:
+                        seed: Optional[int] = None,
+                        rng: Optional[np.random.Generator] = None) -> Union[np.ndarray, pd.Series]:
     """
     Convert infection status to illness status using conditional probabilities.
 
@@ -36,7 +47,9 @@ def infection_to_illness(infection_status: Union[np.ndarray, pd.Series],
         infection_status: Binary array/series (1=infected, 0=not infected) or probabilities (0-1)
         probability_illness_given_infection: Fraction of infected who develop symptoms (0-1)
         population_susceptibility: Fraction of population susceptible to pathogen (0-1)
-        seed: Random seed for reproducibility
+        seed: Random seed for reproducibility (reseeds the global np.random state)
+        rng: Dedicated random Generator for the illness draws, e.g. one per
+            parallel run. Takes precedence over seed.
 
     Returns:
         Array/series of illness status (0 or 1) or illness probability (0-1)
@@ -52,8 +65,11 @@ def infection_to_illness(infection_status: Union[np.ndarray, pd.Series],
         >>> print(f"Infection rate: {infections.mean():.2%}")
         >>> print(f"Illness rate: {illness.mean():.2%}")
     """
-    if seed is not None:
-        np.random.seed(seed)
+    if rng is None:
+        # The np.random module exposes the same sampling methods as a Generator
+        rng = np.random
+        if seed is not None:
+            np.random.seed(seed)
 
     # Convert to numpy array if pandas Series
     is_series = isinstance(infection_status, pd.Series)
@@ -75,13 +91,19 @@ def infection_to_illness(infection_status: Union[np.ndarray, pd.Series],
     # If infection_status is binary (0/1), convert to illness stochastically
     if np.all((infection_status == 0) | (infection_status == 1)):
         # Binary case: randomly assign illness status
-        illness_status = np.zeros_like(infection_status, dtype=float)
-
-        # For infected individuals, apply conditional probability
         infected_mask = infection_status == 1
-        if np.any(infected_mask):
-            random_values = np.random.uniform(0, 1, np.sum(infected_mask))
-            illness_status[infected_mask] = (random_values < adjusted_prob_ill).astype(int)
+        n_infected = np.count_nonzero(infected_mask)
+
+        if n_infected < SPARSE_INFECTION_FRACTION * infected_mask.size:
+            # Few infections: draw only for the infected individuals
+            illness_status = np.zeros_like(infection_status, dtype=float)
+            if n_infected:
+                random_values = rng.random(n_infected)
+                illness_status[infected_mask] = (random_values < adjusted_prob_ill).astype(int)
+        else:
+            # One draw per individual in a single pass, no gather/scatter
+            random_values = rng.random(infection_status.shape)
+            illness_status = ((random_values < adjusted_prob_ill) & infected_mask).astype(float)
 
         result = illness_status
     else:
@@ -114,14 +136,19 @@ def calculate_illness_risk_metrics(illness_array: np.ndarray) -> Dict[str, float
         - min: Minimum value
         - max: Maximum value
     """
+    illness_array = np.asarray(illness_array)
+
+    # One partition yields the extremes and all three quantiles
+    amin, p5, median, p95, amax = np.percentile(illness_array, [0, 5, 50, 95, 100])
+
     return {
         "mean": np.mean(illness_array),
-        "median": np.median(illness_array),
-        "p5": np.percentile(illness_array, 5),
-        "p95": np.percentile(illness_array, 95),
+        "median": median,
+        "p5": p5,
+        "p95": p95,
         "std": np.std(illness_array),
-        "min": np.min(illness_array),
-        "max": np.max(illness_array)
+        "min": amin,
+        "max": amax
     }
 
 
@@ -224,6 +251,31 @@ def get_who_compliance_status(annual_illness_probability: float,
     return status, is_compliant
 
 
+def get_who_compliance_status_vec(annual_illness_probability: np.ndarray,
+                                  guideline_threshold: float = 1e-4) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Determine WHO compliance status for an array of illness risks at once.
+
+    Vectorized form of get_who_compliance_status for whole columns.
+
+    Args:
+        annual_illness_probability: Annual probabilities of illness per person
+        guideline_threshold: WHO threshold (default 1e-4)
+
+    Returns:
+        Tuple of (status_strings_array, is_compliant_array)
+
+    Example:
+        >>> statuses, compliant = get_who_compliance_status_vec(np.array([5e-5, 2e-4]))
+        >>> print(statuses)
+        ['COMPLIANT' 'NON-COMPLIANT']
+    """
+    is_compliant = np.asarray(annual_illness_probability) <= guideline_threshold
+    status = np.where(is_compliant, "COMPLIANT", "NON-COMPLIANT")
+
+    return status, is_compliant
+
+
 def apply_illness_model_to_dataframe(df: pd.DataFrame,
                                     probability_illness_given_infection: float,
                                     population_susceptibility: float = 1.0) -> pd.DataFrame:
@@ -253,28 +305,39 @@ def apply_illness_model_to_dataframe(df: pd.DataFrame,
         ... })
         >>> result = apply_illness_model_to_dataframe(df, 0.60, 0.74)
     """
-    df = df.copy()
-
     adjustment_factor = probability_illness_given_infection * population_susceptibility
 
+    # New columns are collected and attached in one step rather than copying
+    # the whole frame and inserting them one at a time
+    new_columns = {}
+
     # Convert infection risk to illness risk
     if 'Mean_Annual_Risk' in df.columns:
-        df['Mean_Illness_Risk'] = df['Mean_Annual_Risk'] * adjustment_factor
+        new_columns['Mean_Illness_Risk'] = df['Mean_Annual_Risk'].to_numpy() * adjustment_factor
 
     if 'Median_Annual_Risk' in df.columns:
-        df['Median_Illness_Risk'] = df['Median_Annual_Risk'] * adjustment_factor
+        new_columns['Median_Illness_Risk'] = df['Median_Annual_Risk'].to_numpy() * adjustment_factor
 
     if 'P95_Annual_Risk' in df.columns:
-        df['P95_Illness_Risk'] = df['P95_Annual_Risk'] * adjustment_factor
+        new_columns['P95_Illness_Risk'] = df['P95_Annual_Risk'].to_numpy() * adjustment_factor
+
+    # Use Mean_Illness_Risk for classification if available; the whole column
+    # is classified at once, matching classify_illness_risk and
+    # get_who_compliance_status row by row
+    if 'Mean_Illness_Risk' in new_columns or 'Mean_Illness_Risk' in df.columns:
+        illness_risk = new_columns.get('Mean_Illness_Risk')
+        if illness_risk is None:
+            illness_risk = df['Mean_Illness_Risk'].to_numpy(dtype=float)
+        new_columns['Illness_Classification'] = _ILLNESS_RISK_LABELS[
+            np.searchsorted(_ILLNESS_RISK_THRESHOLDS, illness_risk, side='right')
+        ]
+        new_columns['WHO_Compliance'] = get_who_compliance_status_vec(illness_risk)[0]
 
-    # Use Mean_Illness_Risk for classification if available
-    if 'Mean_Illness_Risk' in df.columns:
-        df['Illness_Classification'] = df['Mean_Illness_Risk'].apply(classify_illness_risk)
-        df['WHO_Compliance'] = df['Mean_Illness_Risk'].apply(
-            lambda x: get_who_compliance_status(x)[0]
-        )
+    if any(column in df.columns for column in new_columns):
+        # Recomputed columns keep their current position
+        return df.assign(**new_columns)
 
-    return df
+    return pd.concat([df, pd.DataFrame(new_columns, index=df.index)], axis=1)
 
 
 __all__ = [
@@ -283,5 +346,6 @@ __all__ = [
     'calculate_population_illness_cases',
     'classify_illness_risk',
     'get_who_compliance_status',
+    'get_who_compliance_status_vec',
     'apply_illness_model_to_dataframe'
 ]
@@ -7,7 +7,6 @@ from pathogen exposure doses, including Beta-Poisson and exponential models.
 
 import numpy as np
 from typing import Union, Dict, Optional
-from scipy.special import gamma, gammaln, hyp2f1
 import warnings
 
 